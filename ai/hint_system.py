@@ -1,7 +1,9 @@
 from algorithms.ucs import uniform_cost_search
 from algorithms.a_star import a_star_search
 from algorithms.gbfs import greedy_best_first_search
-from algorithms.gbfs import greedy_best_first_search, get_neighbors
+from algorithms.landmarks import UNREACHABLE
+from algorithms.neighbor_index import get_neighbor_index
+from game.word_validator import neighbors
 
 from algorithms.bfs import bfs
 import random
@@ -9,8 +11,15 @@ import random
 class HintSystem:
     def __init__(self, dictionary):
         self.dictionary = dictionary
+        self.neighbor_index = get_neighbor_index(dictionary)
+        
+    def get_next_move(self, current_word, target_word, solution_path=None, target_distances=None,
+                      optimal_ladders=None):
+        if optimal_ladders is not None:
+            next_word = self.get_best_ladder_step(current_word, optimal_ladders)
+            if next_word:
+                return next_word
         
-    def get_next_move(self, current_word, target_word, solution_path=None):
         if solution_path:
             try:
                 current_index = solution_path.index(current_word)
@@ -19,21 +28,45 @@ class HintSystem:
             except ValueError:
                 pass
         
+        if target_distances is not None:
+            next_word = self.get_optimal_move(current_word, target_distances)
+            if next_word:
+                return next_word
+        
         new_path = bfs(current_word, target_word, self.dictionary)
         if new_path and len(new_path) > 1:
             return new_path[1]  
         
         return self.get_any_valid_move(current_word)
             
+    def get_best_ladder_step(self, word, optimal_ladders):
+        """Of all optimal next steps, the one that keeps the most optimal ladders open."""
+        graph = optimal_ladders.graph
+        word_id = graph.index_of(word.upper())
+        step = optimal_ladders.best_step.get(word_id)
+        return graph.word_at(step) if step is not None else None
+            
+    def get_optimal_move(self, word, target_distances):
+        """A neighbor one step closer to the target, read off its distance map."""
+        graph = self.neighbor_index.graph_for(word)
+        word_id = graph.index_of(word.upper())
+        if word_id is None:
+            return None
+        
+        distance = target_distances[word_id]
+        if distance == UNREACHABLE or distance == 0:
+            return None
+        
+        for neighbor in graph.neighbors(word_id):
+            if target_distances[neighbor] == distance - 1:
+                return graph.word_at(neighbor)
+        
+        return None
+            
     def get_any_valid_move(self, word):
-        for i in range(len(word)):
-            for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                if c == word[i]:
-                    continue
-                    
-                new_word = word[:i] + c + word[i+1:]
-                if new_word in self.dictionary:
-                    return new_word
+        candidates = neighbors(word, self.neighbor_index)
+        if candidates:
+            return candidates[0]
         
         return None
         
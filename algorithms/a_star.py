@@ -1,24 +1,21 @@
-from queue import PriorityQueue
+import heapq
+from algorithms.landmarks import landmark_heuristic
+from algorithms.neighbor_index import get_neighbor_index
 import logging
 
-def a_star_search(start_word, target_word, word_dict):
+def a_star_search(start_word, target_word, word_dict, heuristic='hamming', stats=None, budget=None):
+    """A* over the word graph.
+
+    heuristic='hamming' counts differing letters. heuristic='alt' also uses
+    the graph's precomputed landmark distances and takes the larger of the
+    two bounds, which stays admissible and is much tighter when the ladder
+    has to detour. A SearchStats passed as stats receives the search counters,
+    and a SearchBudget stops the search with a BudgetExceeded result.
+    """
     
-    def heuristic(word1, word2):
+    def hamming(word1, word2):
         return sum(1 for a, b in zip(word1, word2) if a != b)
 
-    def get_neighbors(word, word_dict):
-        neighbors = []
-        word = word.upper()
-        letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-        
-        for i in range(len(word)):
-            for c in letters:
-                if c != word[i]:
-                    neighbor = word[:i] + c + word[i+1:]
-                    if neighbor in word_dict:
-                        neighbors.append(neighbor)
-        return neighbors
-
     def reconstruct_path(came_from, current):
         path = []
         while current in came_from:
@@ -28,31 +25,70 @@ def a_star_search(start_word, target_word, word_dict):
         path.reverse()
         return path
 
+    if heuristic not in ('hamming', 'alt'):
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+
+    track = stats is not None
+    nodes_expanded = nodes_generated = probes = stale_pops = peak_frontier = 0
+
     try:
-        open_set = PriorityQueue()
-        open_set.put((0, start_word))
+        graph = get_neighbor_index(word_dict).graph_for(start_word)
+        start = graph.index_of(start_word)
+        target = graph.index_of(target_word)
+        if start is None or target is None:
+            return None
+
+        if heuristic == 'alt':
+            alt_estimate = landmark_heuristic(graph.landmarks, target)
+
+            def estimate(node):
+                return max(hamming(graph.word_at(node), target_word), alt_estimate(node))
+        else:
+            def estimate(node):
+                return hamming(graph.word_at(node), target_word)
+
+        # Scores exist only for nodes the search has reached. Improved nodes are
+        # pushed again instead of updated in place, and the outdated heap entries
+        # are skipped when popped. Entries are (f, h, node) so that ties on f
+        # favour the node closer to the target.
+        start_h = estimate(start)
+        open_heap = [(start_h, start_h, start)]
         came_from = {}
-        g_score = {word: float('inf') for word in word_dict}
-        g_score[start_word] = 0
-        f_score = {word: float('inf') for word in word_dict}
-        f_score[start_word] = heuristic(start_word, target_word)
+        g_score = {start: 0}
 
-        while not open_set.empty():
-            current = open_set.get()[1]
+        while open_heap:
+            if track and len(open_heap) > peak_frontier:
+                peak_frontier = len(open_heap)
+            f, h, current = heapq.heappop(open_heap)
+            current_g = f - h
 
-            if current == target_word:
-                return reconstruct_path(came_from, current)
+            if current_g > g_score[current]:
+                stale_pops += 1
+                continue
 
-            for neighbor in get_neighbors(current, word_dict):
-                tentative_g_score = g_score[current] + 1
+            if current == target:
+                return graph.to_words(reconstruct_path(came_from, current))
 
-                if tentative_g_score < g_score[neighbor]:
+            if budget is not None and budget.exceeded(nodes_expanded):
+                return budget.result(nodes_expanded, nodes_generated)
+            nodes_expanded += 1
+            tentative_g_score = current_g + 1
+            neighbors = graph.neighbors(current)
+            if track:
+                probes += len(neighbors)
+            for neighbor in neighbors:
+                if tentative_g_score < g_score.get(neighbor, float('inf')):
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, target_word)
-                    open_set.put((f_score[neighbor], neighbor))
+                    neighbor_h = estimate(neighbor)
+                    heapq.heappush(open_heap, (tentative_g_score + neighbor_h, neighbor_h, neighbor))
+                    nodes_generated += 1
 
         return None
     except Exception as e:
         logging.error(f"Error in A* search: {e}")
-        return None
\ No newline at end of file
+        return None
+    finally:
+        if track:
+            stats.record(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+                         dictionary_probes=probes, stale_pops=stale_pops, peak_frontier=peak_frontier)
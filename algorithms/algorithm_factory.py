@@ -1,17 +1,27 @@
 from algorithms.bfs import bfs
+from algorithms.bidirectional_bfs import bidirectional_bfs
 from algorithms.a_star import a_star_search
 from algorithms.ucs import uniform_cost_search
 from algorithms.gbfs import greedy_best_first_search
 
 class AlgorithmFactory:
+    ALGORITHM_NAMES = ['bfs', 'bidirectional_bfs', 'a_star', 'a_star_alt', 'ucs', 'gbfs']
+
+    @staticmethod
+    def list_algorithms():
+        return list(AlgorithmFactory.ALGORITHM_NAMES)
+
     @staticmethod
     def create_algorithm(algorithm_name):
         algorithms = {
             'bfs': bfs,
+            'bidirectional_bfs': bidirectional_bfs,
+            'bibfs': bidirectional_bfs,
             'a_star': a_star_search,
             'a*': a_star_search,  # Add this line to accept 'a*' as input
+            'a_star_alt': lambda s, t, d, **options: a_star_search(s, t, d, heuristic='alt', **options),
             'ucs': uniform_cost_search,
-            'gbfs': lambda s, t, d: greedy_best_first_search(s, t, d)
+            'gbfs': lambda s, t, d, **options: greedy_best_first_search(s, t, d, **options)
         }
         
         if algorithm_name.lower() not in algorithms:
@@ -1,35 +1,80 @@
-from collections import deque
+from algorithms.neighbor_index import get_neighbor_index
 import logging
 
-def bfs(start_word, target_word, word_dict):
+def bfs(start_word, target_word, word_dict, stats_only=False, stats=None, budget=None):
+    """Breadth-first search for a shortest ladder.
 
+    Discovered words only record their parent, and the path is rebuilt once
+    the target is reached. With stats_only=True no path is built at all and
+    a dict with the ladder distance and search counts is returned instead.
+    A SearchStats passed as stats receives the detailed search counters.
+    With a SearchBudget the search stops once it runs out and returns a
+    BudgetExceeded (stats_only: a dict whose budget_exceeded names the limit).
+    """
     if start_word == target_word:
+        if stats_only:
+            return search_stats(0, 0, 1)
         return [start_word]
 
-    queue = deque([(start_word, [start_word])])
-    visited = {start_word}
+    graph = get_neighbor_index(word_dict).graph_for(start_word)
+    start = graph.index_of(start_word)
+    target = graph.index_of(target_word)
+    if start is None or target is None:
+        return search_stats(None, 0, 0) if stats_only else None
 
-    while queue:
-        current_word, path = queue.popleft()
+    track = stats is not None
+    parents = {start: None}
+    frontier = [start]
+    depth = 0
+    nodes_expanded = 0
+    probes = 0
+    peak_frontier = 1
+
+    try:
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for current in frontier:
+                if budget is not None and budget.exceeded(nodes_expanded):
+                    if stats_only:
+                        return dict(search_stats(None, nodes_expanded, len(parents)),
+                                    budget_exceeded=budget.reason)
+                    return budget.result(nodes_expanded, len(parents) - 1)
+                nodes_expanded += 1
+                neighbors = graph.neighbors(current)
+                if track:
+                    probes += len(neighbors)
+                for next_id in neighbors:
+                    if next_id in parents:
+                        continue
+                    parents[next_id] = current
+                    if next_id == target:
+                        if stats_only:
+                            return search_stats(depth, nodes_expanded, len(parents))
+                        return graph.to_words(reconstruct_path(parents, target))
+                    next_frontier.append(next_id)
+            frontier = next_frontier
+            if track and len(frontier) > peak_frontier:
+                peak_frontier = len(frontier)
         
-        for i in range(len(current_word)):
-            for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                next_word = current_word[:i] + c + current_word[i+1:]
-                
-                if next_word in word_dict and next_word not in visited:
-                    if next_word == target_word:
-                        return path + [next_word]
-                    visited.add(next_word)
-                    queue.append((next_word, path + [next_word]))
-    
-    return None
+        return search_stats(None, nodes_expanded, len(parents)) if stats_only else None
+    finally:
+        if track:
+            stats.record(nodes_expanded=nodes_expanded, nodes_generated=len(parents) - 1,
+                         dictionary_probes=probes, peak_frontier=peak_frontier)
+
+def reconstruct_path(parents, node):
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
 
-def get_neighbors(word, word_dict):
-    neighbors = []
-    for i in range(len(word)):
-        for char in 'abcdefghijklmnopqrstuvwxyz':
-            if char != word[i]:
-                new_word = word[:i] + char + word[i+1:]
-                if new_word in word_dict:
-                    neighbors.append(new_word)
-    return neighbors
\ No newline at end of file
+def search_stats(distance, nodes_expanded, nodes_visited):
+    return {
+        'found': distance is not None,
+        'distance': distance,
+        'nodes_expanded': nodes_expanded,
+        'nodes_visited': nodes_visited
+    }
@@ -0,0 +1,106 @@
+from algorithms.bfs import search_stats
+from algorithms.neighbor_index import get_neighbor_index
+
+def bidirectional_bfs(start_word, target_word, word_dict, stats_only=False, stats=None, budget=None):
+    """Shortest ladder found by growing BFS frontiers from both ends.
+
+    Each round expands whichever frontier is smaller by one full level, and
+    the search stops as soon as a newly discovered word is already known to
+    the other side, so the joined path is still a shortest one. stats_only,
+    stats and budget behave as in bfs().
+    """
+    if start_word == target_word:
+        if stats_only:
+            return search_stats(0, 0, 1)
+        return [start_word]
+
+    graph = get_neighbor_index(word_dict).graph_for(start_word)
+    start = graph.index_of(start_word)
+    target = graph.index_of(target_word)
+    if start is None or target is None:
+        return search_stats(None, 0, 0) if stats_only else None
+
+    track = stats is not None
+    forward_parents = {start: None}
+    backward_parents = {target: None}
+    forward_frontier = [start]
+    backward_frontier = [target]
+    nodes_expanded = 0
+    probes = 0
+    peak_frontier = 2
+
+    try:
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting, expanded, scanned = _expand_level(
+                    graph, forward_frontier, forward_parents, backward_parents, track,
+                    budget, nodes_expanded
+                )
+            else:
+                backward_frontier, meeting, expanded, scanned = _expand_level(
+                    graph, backward_frontier, backward_parents, forward_parents, track,
+                    budget, nodes_expanded
+                )
+            nodes_expanded += expanded
+            probes += scanned
+            if track and len(forward_frontier) + len(backward_frontier) > peak_frontier:
+                peak_frontier = len(forward_frontier) + len(backward_frontier)
+
+            if meeting is not None:
+                path = join_paths(forward_parents, backward_parents, meeting)
+                if stats_only:
+                    nodes_visited = len(forward_parents) + len(backward_parents) - 1
+                    return search_stats(len(path) - 1, nodes_expanded, nodes_visited)
+                return graph.to_words(path)
+
+            if budget is not None and budget.reason is not None:
+                nodes_visited = len(forward_parents) + len(backward_parents)
+                if stats_only:
+                    return dict(search_stats(None, nodes_expanded, nodes_visited),
+                                budget_exceeded=budget.reason)
+                return budget.result(nodes_expanded, nodes_visited - 2)
+
+        if stats_only:
+            return search_stats(None, nodes_expanded, len(forward_parents) + len(backward_parents))
+        return None
+    finally:
+        if track:
+            stats.record(nodes_expanded=nodes_expanded,
+                         nodes_generated=len(forward_parents) + len(backward_parents) - 2,
+                         dictionary_probes=probes, peak_frontier=peak_frontier)
+
+def _expand_level(graph, frontier, parents, other_parents, track=False, budget=None, expanded_before=0):
+    """Expand one BFS level; returns (next_frontier, meeting, expanded, probes).
+
+    If budget runs out part-way, the level is cut short and budget.reason is set.
+    """
+    next_frontier = []
+    probes = 0
+    for expanded, current in enumerate(frontier, 1):
+        if budget is not None and budget.exceeded(expanded_before + expanded - 1):
+            return next_frontier, None, expanded - 1, probes
+        neighbors = graph.neighbors(current)
+        if track:
+            probes += len(neighbors)
+        for neighbor in neighbors:
+            if neighbor in parents:
+                continue
+            parents[neighbor] = current
+            if neighbor in other_parents:
+                return next_frontier, neighbor, expanded, probes
+            next_frontier.append(neighbor)
+    return next_frontier, None, len(frontier), probes
+
+def join_paths(forward_parents, backward_parents, meeting):
+    path = []
+    node = meeting
+    while node is not None:
+        path.append(node)
+        node = forward_parents[node]
+    path.reverse()
+
+    node = backward_parents[meeting]
+    while node is not None:
+        path.append(node)
+        node = backward_parents[node]
+    return path
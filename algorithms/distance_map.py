@@ -0,0 +1,72 @@
+from algorithms.landmarks import UNREACHABLE
+from algorithms.neighbor_index import get_neighbor_index
+
+
+class DistanceMap:
+    """Ladder distance from one source word to every word of the same length.
+
+    distances is the compact uint8 array from one BFS, indexed by the word
+    IDs of graph. UNREACHABLE marks words in another component and, when a
+    max_depth was given, words farther away than that.
+    """
+
+    def __init__(self, graph, source, distances, max_depth=None):
+        self.graph = graph
+        self.source = source
+        self.distances = distances
+        self.max_depth = max_depth
+
+    @property
+    def source_word(self):
+        return self.graph.word_at(self.source)
+
+    def distance_to(self, word):
+        """Ladder distance to word, or None if it is unreachable or unknown."""
+        word_id = self.graph.index_of(word.upper())
+        if word_id is None or self.distances[word_id] == UNREACHABLE:
+            return None
+        return self.distances[word_id]
+
+    def ids_at(self, distance):
+        if not 0 <= distance < UNREACHABLE:
+            return []
+        return [word_id for word_id, d in enumerate(self.distances) if d == distance]
+
+    def ids_between(self, lowest, highest):
+        return [word_id for word_id, d in enumerate(self.distances) if lowest <= d <= highest and d != UNREACHABLE]
+
+    def words_at(self, distance):
+        return self.graph.to_words(self.ids_at(distance))
+
+    def words_within(self, k):
+        """Words 1 to k steps from the source."""
+        return self.graph.to_words(self.ids_between(1, k))
+
+    def count_within(self, k):
+        return sum(1 for d in self.distances if 1 <= d <= k and d != UNREACHABLE)
+
+    def histogram(self):
+        """Number of reachable words at each distance, the source included at 0."""
+        counts = {}
+        for d in self.distances:
+            if d != UNREACHABLE:
+                counts[d] = counts.get(d, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def eccentricity(self):
+        """Largest distance to a reachable word."""
+        return max((d for d in self.distances if d != UNREACHABLE), default=0)
+
+
+def distances_from(word, word_dict, max_depth=None):
+    """One-to-all BFS from word over its length's graph, or None if word is unknown.
+
+    With max_depth the BFS stops early, which is all that "words within k
+    steps" or "a word exactly k steps away" need.
+    """
+    word = word.upper()
+    graph = get_neighbor_index(word_dict).graph_for(word)
+    source = graph.index_of(word)
+    if source is None:
+        return None
+    return DistanceMap(graph, source, graph.distances_from(source, max_depth), max_depth)
@@ -1,50 +1,63 @@
-def greedy_best_first_search(start_word, target_word, word_dict, heuristic=None):
+from algorithms.neighbor_index import get_neighbor_index
+
+def greedy_best_first_search(start_word, target_word, word_dict, heuristic=None, stats=None, budget=None):
 
     from queue import PriorityQueue
 
     if heuristic is None:
         heuristic = lambda word, target: sum(1 for a, b in zip(word, target) if a != b)
     
+    graph = get_neighbor_index(word_dict).graph_for(start_word)
+    start = graph.index_of(start_word)
+    target = graph.index_of(target_word)
+    if start is None or target is None:
+        return None
+
+    track = stats is not None
+    nodes_expanded = probes = peak_frontier = 0
+
     open_set = PriorityQueue()
-    open_set.put((0, start_word))
+    open_set.put((0, start))
     
     came_from = {}
     
-    visited = set([start_word])
+    visited = set([start])
     
-    while not open_set.empty():
-        current_cost, current_word = open_set.get()
+    try:
+        while not open_set.empty():
+            if track and open_set.qsize() > peak_frontier:
+                peak_frontier = open_set.qsize()
+            current_cost, current = open_set.get()
 
-        if current_word == target_word:
-            return reconstruct_path(came_from, current_word)
+            if current == target:
+                return graph.to_words(reconstruct_path(came_from, current))
 
-        for neighbor in get_neighbors(current_word, word_dict):
-            if neighbor in visited:
-                continue
+            if budget is not None and budget.exceeded(nodes_expanded):
+                return budget.result(nodes_expanded, len(visited) - 1)
+            nodes_expanded += 1
+            neighbors = graph.neighbors(current)
+            if track:
+                probes += len(neighbors)
+            for neighbor in neighbors:
+                if neighbor in visited:
+                    continue
+                    
+                visited.add(neighbor)
                 
-            visited.add(neighbor)
-            
-            came_from[neighbor] = current_word
-                
-            priority = heuristic(neighbor, target_word)
-            open_set.put((priority, neighbor))
-
-    return None  
-
-def get_neighbors(word, word_dict):
-    neighbors = []
-    for i in range(len(word)):
-        for char in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-            if char == word[i]:
-                continue
-            neighbor = word[:i] + char + word[i+1:]
-            if neighbor in word_dict:
-                neighbors.append(neighbor)
-    return neighbors
+                came_from[neighbor] = current
+                    
+                priority = heuristic(graph.word_at(neighbor), target_word)
+                open_set.put((priority, neighbor))
+
+        return None  
+    finally:
+        if track:
+            stats.record(nodes_expanded=nodes_expanded, nodes_generated=len(visited) - 1,
+                         dictionary_probes=probes, peak_frontier=peak_frontier)
 
 def reconstruct_path(came_from, current_word):
     total_path = [current_word]
     while current_word in came_from:
         current_word = came_from[current_word]
         total_path.append(current_word)
-    return total_path[::-1]  
\ No newline at end of file
+    return total_path[::-1]  
@@ -0,0 +1,73 @@
+from array import array
+
+# Components at least this share of the largest one count as large.
+DEFAULT_MIN_COMPONENT_SHARE = 0.5
+
+
+class HubIndex:
+    """Neighbor degree and component size of every word of one WordGraph.
+
+    Built in one linear pass over the CSR offsets and component labels.
+    hubs holds the IDs of well-connected words: those in a large component
+    whose degree is at least the median degree of that set, so any two hubs
+    of the same component are joined by a ladder.
+    """
+
+    def __init__(self, graph, min_component_share=DEFAULT_MIN_COMPONENT_SHARE):
+        self.graph = graph
+        count = len(graph)
+        offsets = graph.offsets
+        self.degrees = array('I', [0]) * count
+        for word_id in range(count):
+            self.degrees[word_id] = offsets[word_id + 1] - offsets[word_id]
+
+        sizes = graph.component_sizes
+        self.largest_component_size = max(sizes) if len(sizes) else 0
+        self.min_component_size = max(2, self.largest_component_size * min_component_share)
+
+        components = graph.components
+        candidates = [word_id for word_id in range(count) if sizes[components[word_id]] >= self.min_component_size]
+        self.min_hub_degree = _median_degree(self.degrees, candidates)
+        self.hubs = array('I', [word_id for word_id in candidates if self.degrees[word_id] >= self.min_hub_degree])
+
+    def __len__(self):
+        return len(self.hubs)
+
+    def degree(self, word_id):
+        return self.degrees[word_id]
+
+    def component_size(self, word_id):
+        return self.graph.component_size(word_id)
+
+    def is_hub(self, word_id):
+        return (self.degrees[word_id] >= self.min_hub_degree
+                and self.graph.component_size(word_id) >= self.min_component_size)
+
+    def hub_words(self):
+        return self.graph.to_words(self.hubs)
+
+    def stats(self):
+        return {
+            'words': len(self.graph),
+            'edges': len(self.graph.targets) // 2,
+            'components': len(self.graph.component_sizes),
+            'largest_component': self.largest_component_size,
+            'hubs': len(self.hubs),
+            'min_hub_degree': self.min_hub_degree,
+            'max_degree': max(self.degrees) if len(self.degrees) else 0
+        }
+
+
+def _median_degree(degrees, word_ids):
+    """Median degree of word_ids by counting, so it stays linear."""
+    if not word_ids:
+        return 0
+    counts = [0] * (max(degrees[word_id] for word_id in word_ids) + 1)
+    for word_id in word_ids:
+        counts[degrees[word_id]] += 1
+    remaining = len(word_ids) // 2
+    for degree, count in enumerate(counts):
+        remaining -= count
+        if remaining < 0:
+            return degree
+    return len(counts) - 1
@@ -0,0 +1,105 @@
+from array import array
+from collections import Counter
+
+UNREACHABLE = 255
+DEFAULT_LANDMARK_COUNT = 8
+
+
+def bfs_distances(graph, source, max_depth=None):
+    """Ladder distance from source to every word of the graph as a uint8 array.
+
+    Words in another component, and the (rare) ones 255 or more steps away,
+    are marked UNREACHABLE. With max_depth the search stops at that depth and
+    words farther away are left UNREACHABLE too.
+    """
+    distances = array('B', [UNREACHABLE]) * len(graph)
+    distances[source] = 0
+    frontier = [source]
+    depth = 0
+    offsets, targets = graph.offsets, graph.targets
+    limit = UNREACHABLE - 1 if max_depth is None else min(max_depth, UNREACHABLE - 1)
+
+    while frontier and depth < limit:
+        depth += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if distances[neighbor] == UNREACHABLE:
+                    distances[neighbor] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return distances
+
+
+def select_landmarks(graph, count=DEFAULT_LANDMARK_COUNT):
+    """Pick landmarks by farthest-point selection inside the largest component.
+
+    Returns a list of (landmark_id, distances) pairs, distances being the
+    bfs_distances() array of that landmark.
+    """
+    if len(graph) == 0 or count <= 0:
+        return []
+
+    components = graph.components
+    largest, size = Counter(components).most_common(1)[0]
+    if size < 2:
+        return []
+
+    seed = next(node for node in range(len(graph)) if components[node] == largest)
+    seed_distances = bfs_distances(graph, seed)
+
+    landmarks = []
+    closest = None
+    candidate = _farthest(seed_distances, None)
+    while candidate is not None and len(landmarks) < count:
+        distances = bfs_distances(graph, candidate)
+        landmarks.append((candidate, distances))
+
+        if closest is None:
+            closest = array('B', distances)
+        else:
+            for node, distance in enumerate(distances):
+                if distance < closest[node]:
+                    closest[node] = distance
+
+        candidate = _farthest(closest, seed_distances)
+
+    return landmarks
+
+
+def _farthest(distances, reachable):
+    """Index of the largest finite distance, restricted to words reachable from the seed."""
+    best, best_distance = None, 0
+    for node, distance in enumerate(distances):
+        if distance == UNREACHABLE or distance <= best_distance:
+            continue
+        if reachable is not None and reachable[node] == UNREACHABLE:
+            continue
+        best, best_distance = node, distance
+    return best
+
+
+def landmark_heuristic(landmarks, target):
+    """Admissible ALT lower bound on the distance from a node to target.
+
+    By the triangle inequality |d(L, target) - d(L, node)| never exceeds the
+    true distance, for any landmark L that reaches both words.
+    """
+    usable = [(distances, distances[target]) for _, distances in landmarks
+              if distances[target] != UNREACHABLE]
+
+    def estimate(node):
+        best = 0
+        for distances, target_distance in usable:
+            node_distance = distances[node]
+            if node_distance == UNREACHABLE:
+                continue
+            bound = node_distance - target_distance
+            if bound < 0:
+                bound = -bound
+            if bound > best:
+                best = bound
+        return best
+
+    return estimate
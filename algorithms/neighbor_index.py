@@ -0,0 +1,143 @@
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Set
+import threading
+import uuid
+import weakref
+from algorithms.hub_index import HubIndex
+from algorithms.word_graph import WordGraph
+
+
+class NeighborIndex(Set):
+    """Dictionary words split by length into integer-ID WordGraphs.
+
+    Neighbors only ever share the word's length, so each length gets its own
+    CSR graph, built lazily the first time a word of that length is searched.
+    Words are kept as one sorted sequence per length, which is also what a
+    graph uses for its IDs, so membership is a binary search. fingerprint
+    identifies the word list, e.g. for caches of solved ladders.
+    """
+
+    def __init__(self, words=(), graphs=None, fingerprint=None):
+        self.fingerprint = fingerprint or uuid.uuid4().hex
+        self.dictionary_file = None
+        self.graphs = dict(graphs or {})
+        self.hub_indexes = {}
+        self.words_by_length = {length: graph.words for length, graph in self.graphs.items()}
+
+        by_length = defaultdict(set)
+        for word in words:
+            by_length[len(word)].add(word.upper())
+        for length, group in by_length.items():
+            if length not in self.words_by_length:
+                self.words_by_length[length] = sorted(group)
+
+        self._size = sum(len(group) for group in self.words_by_length.values())
+        self._lock = threading.Lock()
+
+    def __contains__(self, word):
+        if not isinstance(word, str):
+            return False
+        word = word.upper()
+        words = self.words_by_length.get(len(word))
+        if not words:
+            return False
+        i = bisect_left(words, word)
+        return i < len(words) and words[i] == word
+
+    def __iter__(self):
+        for length in sorted(self.words_by_length):
+            yield from self.words_by_length[length]
+
+    def __len__(self):
+        return self._size
+
+    def lengths(self):
+        return sorted(self.words_by_length)
+
+    def graph(self, length):
+        graph = self.graphs.get(length)
+        if graph is not None:
+            return graph
+
+        with self._lock:
+            graph = self.graphs.get(length)
+            if graph is None:
+                graph = WordGraph.build(length, self.words_by_length.get(length, []))
+                self.graphs[length] = graph
+            return graph
+
+    def hub_index(self, length):
+        """Degree, component-size and hub statistics for one length, built once."""
+        hubs = self.hub_indexes.get(length)
+        if hubs is not None:
+            return hubs
+
+        graph = self.graph(length)
+        with self._lock:
+            hubs = self.hub_indexes.get(length)
+            if hubs is None:
+                hubs = HubIndex(graph)
+                self.hub_indexes[length] = hubs
+            return hubs
+
+    def graph_for(self, word):
+        return self.graph(len(word))
+
+    def are_connected(self, word_a, word_b):
+        """True when a ladder exists between the two words, without searching."""
+        word_a, word_b = word_a.upper(), word_b.upper()
+        if len(word_a) != len(word_b):
+            return False
+        graph = self.graph_for(word_a)
+        a, b = graph.index_of(word_a), graph.index_of(word_b)
+        if a is None or b is None:
+            return False
+        return graph.are_connected(a, b)
+
+    def get_neighbors(self, word):
+        word = word.upper()
+        graph = self.graph_for(word)
+        word_id = graph.index_of(word)
+        if word_id is None:
+            return []
+        return graph.to_words(graph.neighbors(word_id))
+
+
+_index_cache = {}
+_index_cache_lock = threading.Lock()
+
+
+def get_neighbor_index(word_dict):
+    """Return the NeighborIndex for word_dict, building it once per dictionary object.
+
+    Sets and other weak-referenceable dictionaries drop out of the cache when
+    they are collected. Lists and dicts cannot be weakly referenced, so they
+    are kept alive by the cache until clear_neighbor_index_cache().
+    """
+    if isinstance(word_dict, NeighborIndex):
+        return word_dict
+
+    key = id(word_dict)
+    with _index_cache_lock:
+        cached = _index_cache.get(key)
+        if cached is not None and cached[0]() is word_dict:
+            return cached[1]
+
+        index = NeighborIndex(word_dict)
+        try:
+            ref = weakref.ref(word_dict, lambda _, key=key: _index_cache.pop(key, None))
+        except TypeError:
+            ref = lambda word_dict=word_dict: word_dict
+
+        _index_cache[key] = (ref, index)
+        return index
+
+
+def clear_neighbor_index_cache():
+    with _index_cache_lock:
+        _index_cache.clear()
+
+
+def get_neighbors(word, word_dict):
+    return get_neighbor_index(word_dict).get_neighbors(word)
@@ -0,0 +1,160 @@
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import logging
+import multiprocessing
+import os
+import threading
+import time
+
+from algorithms.algorithm_factory import AlgorithmFactory
+from algorithms.neighbor_index import get_neighbor_index
+from algorithms.search_budget import BudgetExceeded, CancellationToken, SearchBudget
+from algorithms.search_stats import SearchStats
+
+COMPARISON_ALGORITHMS = ['bfs', 'bidirectional_bfs', 'a_star', 'ucs', 'gbfs']
+DEFAULT_TIMEOUT = 10.0
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+# Set in each worker process by _init_worker.
+_worker_dictionary = None
+
+
+def _init_worker(dictionary_file):
+    global _worker_dictionary
+    from utils.dictionary_loader import get_shared_dictionary
+    _worker_dictionary = get_shared_dictionary(dictionary_file).get_all_words()
+
+
+def _solve_in_worker(name, start_word, target_word, max_seconds=None):
+    budget = SearchBudget(max_seconds=max_seconds) if max_seconds is not None else None
+    return solve(name, start_word, target_word, _worker_dictionary, budget=budget)
+
+
+def solve(name, start_word, target_word, word_dict, collect_stats=True, budget=None):
+    """Run one algorithm and return its comparison record.
+
+    With collect_stats the record also carries the SearchStats counters
+    (nodes_expanded, nodes_generated, dictionary_probes, stale_pops,
+    peak_frontier). A search stopped by budget has no path and names the
+    exhausted limit in budget_exceeded.
+    """
+    algorithm = AlgorithmFactory.create_algorithm(name)
+    options = {}
+    stats = SearchStats() if collect_stats else None
+    if stats is not None:
+        options['stats'] = stats
+    if budget is not None:
+        options['budget'] = budget
+    start_ns = time.perf_counter_ns()
+    path = algorithm(start_word, target_word, word_dict, **options)
+    elapsed_ns = time.perf_counter_ns() - start_ns
+    exceeded = path if isinstance(path, BudgetExceeded) else None
+    if exceeded is not None:
+        path = None
+    result = {
+        'time_taken': elapsed_ns / 1e9,
+        'time_ns': elapsed_ns,
+        'path_length': len(path) - 1 if path else None,
+        'path': path
+    }
+    if stats is not None:
+        result.update(stats.as_dict())
+    if exceeded is not None:
+        result['budget_exceeded'] = exceeded.reason
+    return result
+
+
+def failed_result(**extra):
+    return dict({'time_taken': 0, 'path_length': None, 'path': None}, **extra)
+
+
+def _worker_context():
+    """forkserver (spawn where it is missing) rather than fork.
+
+    The pool is created lazily from a thread of a multi-threaded server, and a
+    forked child could inherit a lock another thread held at that moment.
+    Workers only map the compiled file, so a fresh interpreter costs little.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _get_executor(index):
+    """Process pool whose workers map the same compiled dictionary file.
+
+    Indexes that were not loaded from a file cannot be shared with other
+    processes, so they fall back to a thread pool over the same object.
+    """
+    dictionary_file = getattr(index, 'dictionary_file', None)
+    key = os.path.abspath(dictionary_file) if dictionary_file else None
+
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            workers = min(len(COMPARISON_ALGORITHMS), os.cpu_count() or 1)
+            if dictionary_file:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=_worker_context(),
+                    initializer=_init_worker,
+                    initargs=(dictionary_file,)
+                )
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers)
+            _executors[key] = executor
+        return executor, bool(dictionary_file)
+
+
+def _discard_executor(executor):
+    with _executors_lock:
+        for key, candidate in list(_executors.items()):
+            if candidate is executor:
+                del _executors[key]
+    executor.shutdown(wait=False)
+
+
+def run_comparison(start_word, target_word, word_dict, names=None, timeout=DEFAULT_TIMEOUT):
+    """Run several algorithms concurrently and collect their results by name.
+
+    Every algorithm gets the same timeout, measured from submission. One that
+    has not finished by then is reported with timed_out=True. The timeout is
+    also each search's time budget, so a search that overruns stops on its
+    own instead of holding a worker.
+    """
+    names = list(names or COMPARISON_ALGORITHMS)
+    index = get_neighbor_index(word_dict)
+    executor, in_processes = _get_executor(index)
+    token = CancellationToken()
+
+    futures = {}
+    for name in names:
+        if in_processes:
+            futures[name] = executor.submit(_solve_in_worker, name, start_word, target_word, timeout)
+        else:
+            budget = SearchBudget(max_seconds=timeout, token=token)
+            futures[name] = executor.submit(solve, name, start_word, target_word, index, budget=budget)
+
+    wait(futures.values(), timeout=timeout)
+    token.cancel()
+
+    results = {}
+    for name, future in futures.items():
+        if not future.done():
+            future.cancel()
+            logging.warning(f"Algorithm {name} timed out after {timeout}s")
+            results[name] = failed_result(timed_out=True)
+            continue
+        try:
+            results[name] = future.result()
+            if results[name].get('budget_exceeded') in ('time', 'cancelled'):
+                logging.warning(f"Algorithm {name} timed out after {timeout}s")
+                results[name]['timed_out'] = True
+        except BrokenExecutor as e:
+            logging.error(f"Worker pool failed while running {name}: {str(e)}")
+            _discard_executor(executor)
+            results[name] = failed_result(error=str(e))
+        except Exception as e:
+            logging.error(f"Error running algorithm {name}: {str(e)}")
+            results[name] = failed_result(error=str(e))
+    return results
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+import threading
+
+DEFAULT_MAX_SIZE = 2048
+
+_MISSING = object()
+
+
+class PathCache:
+    """Size-bounded LRU cache of solver results keyed by (start, target, algorithm).
+
+    Keys also carry the dictionary fingerprint, so results computed against
+    one word list are never served for another. A ladder is reversible, so
+    a stored A -> B result also answers B -> A; those count as reverse hits.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.reverse_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(start_word, target_word, algorithm, fingerprint):
+        return (fingerprint, algorithm, start_word, target_word)
+
+    def get(self, start_word, target_word, algorithm, fingerprint):
+        """Return a copy of the cached result dict, or None on a miss."""
+        with self._lock:
+            key = self._key(start_word, target_word, algorithm, fingerprint)
+            result = self._entries.get(key, _MISSING)
+            if result is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy_result(result, reverse=False)
+
+            reverse_key = self._key(target_word, start_word, algorithm, fingerprint)
+            result = self._entries.get(reverse_key, _MISSING)
+            if result is not _MISSING:
+                self._entries.move_to_end(reverse_key)
+                self.hits += 1
+                self.reverse_hits += 1
+                return _copy_result(result, reverse=True)
+
+            self.misses += 1
+            return None
+
+    def put(self, start_word, target_word, algorithm, fingerprint, result):
+        if self.max_size <= 0:
+            return
+        
+        stored = dict(result)
+        if stored.get('path') is not None:
+            stored['path'] = tuple(stored['path'])
+        
+        with self._lock:
+            key = self._key(start_word, target_word, algorithm, fingerprint)
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, fingerprint=None):
+        """Drop every entry, or only those computed against fingerprint."""
+        with self._lock:
+            if fingerprint is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == fingerprint]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'reverse_hits': self.reverse_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+def _copy_result(result, reverse):
+    copied = dict(result)
+    path = copied.get('path')
+    if path is not None:
+        copied['path'] = list(reversed(path)) if reverse else list(path)
+    copied['cached'] = True
+    return copied
+
+
+shared_path_cache = PathCache()
+
+
+def get_path_cache():
+    return shared_path_cache
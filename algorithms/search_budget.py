@@ -0,0 +1,75 @@
+import threading
+import time
+
+
+class CancellationToken:
+    """Shared flag a caller sets to stop searches that were given it."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class BudgetExceeded:
+    """Result of a search that stopped on its budget instead of finishing.
+
+    It is falsy, so callers that only test `if path:` treat it as no ladder,
+    and it carries the reason ('nodes', 'time' or 'cancelled') together with
+    the counts reached so far.
+    """
+
+    __slots__ = ('reason', 'nodes_expanded', 'nodes_generated', 'elapsed')
+
+    def __init__(self, reason, nodes_expanded, nodes_generated, elapsed):
+        self.reason = reason
+        self.nodes_expanded = nodes_expanded
+        self.nodes_generated = nodes_generated
+        self.elapsed = elapsed
+
+    def __bool__(self):
+        return False
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (f"BudgetExceeded(reason={self.reason!r}, nodes_expanded={self.nodes_expanded}, "
+                f"elapsed={self.elapsed:.3f})")
+
+
+class SearchBudget:
+    """Limits for one search: expanded nodes, wall-clock seconds and a token.
+
+    The clock starts when the budget is created, so make one per search.
+    Solvers call exceeded() before each expansion with the number of nodes
+    expanded so far; after it returns True the budget remembers why in reason.
+    """
+
+    def __init__(self, max_nodes=None, max_seconds=None, token=None):
+        self.max_nodes = max_nodes
+        self.max_seconds = max_seconds
+        self.token = token
+        self.started = time.perf_counter()
+        self.deadline = self.started + max_seconds if max_seconds is not None else None
+        self.reason = None
+
+    def exceeded(self, nodes_expanded):
+        if self.reason is not None:
+            return True
+        if self.max_nodes is not None and nodes_expanded >= self.max_nodes:
+            self.reason = 'nodes'
+        elif self.token is not None and self.token.cancelled:
+            self.reason = 'cancelled'
+        elif self.deadline is not None and time.perf_counter() > self.deadline:
+            self.reason = 'time'
+        return self.reason is not None
+
+    def result(self, nodes_expanded, nodes_generated):
+        return BudgetExceeded(self.reason, nodes_expanded, nodes_generated,
+                              time.perf_counter() - self.started)
@@ -0,0 +1,33 @@
+class SearchStats:
+    """Counters filled in by a solver when one is passed as stats=.
+
+    Solvers keep their counts in local variables and call record() once when
+    they finish, so a search run without a collector pays only for a few
+    `if track` checks.
+
+    nodes_expanded     words whose neighbor lists were scanned
+    nodes_generated    words added to the frontier (including re-pushes)
+    dictionary_probes  neighbor entries examined, i.e. adjacency lookups
+    stale_pops         outdated or already-closed entries popped and skipped
+    peak_frontier      largest frontier / open-set size seen
+    """
+
+    __slots__ = ('nodes_expanded', 'nodes_generated', 'dictionary_probes', 'stale_pops', 'peak_frontier')
+
+    def __init__(self):
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.dictionary_probes = 0
+        self.stale_pops = 0
+        self.peak_frontier = 0
+
+    def record(self, nodes_expanded=0, nodes_generated=0, dictionary_probes=0, stale_pops=0, peak_frontier=0):
+        self.nodes_expanded += nodes_expanded
+        self.nodes_generated += nodes_generated
+        self.dictionary_probes += dictionary_probes
+        self.stale_pops += stale_pops
+        if peak_frontier > self.peak_frontier:
+            self.peak_frontier = peak_frontier
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
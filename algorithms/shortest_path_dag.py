@@ -0,0 +1,129 @@
+from algorithms.neighbor_index import get_neighbor_index
+
+
+class ShortestPathDag:
+    """Every shortest ladder between two words of one WordGraph, without listing them.
+
+    A BFS layering from start, stopped at the target's depth, is swept back
+    from the target so that layers[k] keeps only the words k steps from start
+    on some shortest ladder and successors links each to its words in layer
+    k + 1. Ladder counts through every word are plain integer DP over the
+    layers, so they stay exact however large they grow, and the ladders
+    themselves are only produced on demand by ladders().
+    """
+
+    def __init__(self, graph, start, target):
+        self.graph = graph
+        self.start = start
+        self.target = target
+        self.layers = []
+        self.successors = {}
+        self.paths_to_target = {}
+        self.paths_from_start = {}
+        self.best_step = {}
+        self._build()
+
+    def _build(self):
+        graph, start, target = self.graph, self.start, self.target
+        forward = [[start]]
+        seen = {start}
+        while target not in seen and forward[-1]:
+            layer = []
+            for node in forward[-1]:
+                for neighbor in graph.neighbors(node):
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        layer.append(neighbor)
+            forward.append(layer)
+        if target not in seen:
+            return
+
+        self.successors[target] = ()
+        self.paths_to_target[target] = 1
+        layers = [[target]]
+        for layer in reversed(forward[:-1]):
+            next_layer = set(layers[-1])
+            kept = []
+            for node in layer:
+                steps = tuple(neighbor for neighbor in graph.neighbors(node) if neighbor in next_layer)
+                if steps:
+                    kept.append(node)
+                    self.successors[node] = steps
+                    self.paths_to_target[node] = sum(self.paths_to_target[step] for step in steps)
+                    self.best_step[node] = max(steps, key=self.paths_to_target.__getitem__)
+            layers.append(kept)
+        layers.reverse()
+        self.layers = layers
+
+        self.paths_from_start[start] = 1
+        for layer in layers[:-1]:
+            for node in layer:
+                for step in self.successors[node]:
+                    self.paths_from_start[step] = self.paths_from_start.get(step, 0) + self.paths_from_start[node]
+
+    @property
+    def distance(self):
+        return len(self.layers) - 1 if self.layers else None
+
+    def count(self):
+        """Number of distinct shortest ladders from start to target."""
+        return self.paths_to_target.get(self.start, 0)
+
+    def paths_through(self, node):
+        """Number of shortest ladders that pass through node."""
+        return self.paths_from_start.get(node, 0) * self.paths_to_target.get(node, 0)
+
+    def __contains__(self, node):
+        return node in self.successors
+
+    def next_steps(self, node):
+        return self.successors.get(node, ())
+
+    def ladders(self):
+        """Yield every shortest ladder as a list of words, in alphabetical order."""
+        if not self.layers:
+            return
+        if self.start == self.target:
+            yield self.graph.to_words([self.start])
+            return
+        path = [self.start]
+        stack = [iter(self.successors[self.start])]
+        while stack:
+            step = next(stack[-1], None)
+            if step is None:
+                stack.pop()
+                path.pop()
+                continue
+            path.append(step)
+            if step == self.target:
+                yield self.graph.to_words(path)
+                path.pop()
+            else:
+                stack.append(iter(self.successors[step]))
+
+    def rank(self, words):
+        """Position of a ladder in ladders() order, or None if it is not a shortest one."""
+        ids = [self.graph.index_of(word.upper()) for word in words]
+        if not self.layers or len(ids) != len(self.layers) or ids[0] != self.start:
+            return None
+        position = 0
+        for node, step in zip(ids, ids[1:]):
+            steps = self.successors.get(node, ())
+            if step not in steps:
+                return None
+            for earlier in steps[:steps.index(step)]:
+                position += self.paths_to_target[earlier]
+        return position
+
+
+def build_shortest_path_dag(start_word, target_word, word_dict):
+    """ShortestPathDag between two words, or None if either is not in word_dict."""
+    start_word, target_word = start_word.upper(), target_word.upper()
+    if len(start_word) != len(target_word):
+        return None
+    graph = get_neighbor_index(word_dict).graph_for(start_word)
+    start = graph.index_of(start_word)
+    target = graph.index_of(target_word)
+    if start is None or target is None:
+        return None
+    return ShortestPathDag(graph, start, target)
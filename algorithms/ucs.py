@@ -1,4 +1,5 @@
 from queue import PriorityQueue
+from algorithms.neighbor_index import get_neighbor_index
 
 class Node:
     def __init__(self, word, cost, parent=None):
@@ -9,40 +10,53 @@ class Node:
     def __lt__(self, other):
         return self.cost < other.cost
 
-def uniform_cost_search(start_word, target_word, word_dict):
+def uniform_cost_search(start_word, target_word, word_dict, stats=None, budget=None):
     if start_word == target_word:
         return [start_word]
 
+    graph = get_neighbor_index(word_dict).graph_for(start_word)
+    start = graph.index_of(start_word)
+    target = graph.index_of(target_word)
+    if start is None or target is None:
+        return None
+
+    track = stats is not None
+    nodes_generated = probes = stale_pops = peak_frontier = 0
+
     visited = set()
     priority_queue = PriorityQueue()
-    priority_queue.put(Node(start_word, 0))
-
-    while not priority_queue.empty():
-        current_node = priority_queue.get()
-        current_word = current_node.word
+    priority_queue.put(Node(start, 0))
 
-        if current_word in visited:
-            continue
-        visited.add(current_word)
+    try:
+        while not priority_queue.empty():
+            if track and priority_queue.qsize() > peak_frontier:
+                peak_frontier = priority_queue.qsize()
+            current_node = priority_queue.get()
+            current = current_node.word
 
-        for neighbor in get_neighbors(current_word, word_dict):
-            if neighbor == target_word:
-                return reconstruct_path(current_node, neighbor)
+            if current in visited:
+                stale_pops += 1
+                continue
+            if budget is not None and budget.exceeded(len(visited)):
+                return budget.result(len(visited), nodes_generated)
+            visited.add(current)
 
-            new_cost = current_node.cost + 1 
-            priority_queue.put(Node(neighbor, new_cost, current_node))
+            neighbors = graph.neighbors(current)
+            if track:
+                probes += len(neighbors)
+            for neighbor in neighbors:
+                if neighbor == target:
+                    return graph.to_words(reconstruct_path(current_node, neighbor))
 
-    return None
+                new_cost = current_node.cost + 1 
+                priority_queue.put(Node(neighbor, new_cost, current_node))
+                nodes_generated += 1
 
-def get_neighbors(word, word_dict):
-    neighbors = []
-    for i in range(len(word)):
-        for char in 'abcdefghijklmnopqrstuvwxyz':
-            if char != word[i]:
-                new_word = word[:i] + char + word[i+1:]
-                if new_word in word_dict:
-                    neighbors.append(new_word)
-    return neighbors
+        return None
+    finally:
+        if track:
+            stats.record(nodes_expanded=len(visited), nodes_generated=nodes_generated,
+                         dictionary_probes=probes, stale_pops=stale_pops, peak_frontier=peak_frontier)
 
 def reconstruct_path(node, target_word):
     path = []
@@ -50,4 +64,5 @@ def reconstruct_path(node, target_word):
         path.append(node.word)
         node = node.parent
     path.reverse()
-    return path
\ No newline at end of file
+    path.append(target_word)
+    return path
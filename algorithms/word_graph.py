@@ -0,0 +1,145 @@
+from array import array
+from bisect import bisect_left
+from algorithms.landmarks import bfs_distances, select_landmarks
+
+WILDCARD = '_'
+
+
+def wildcard_patterns(word):
+    return [word[:i] + WILDCARD + word[i+1:] for i in range(len(word))]
+
+
+class WordGraph:
+    """One-letter-change graph over the dictionary words of a single length.
+
+    Words are sorted and identified by their position, and adjacency is kept
+    in CSR form: the neighbors of word i are targets[offsets[i]:offsets[i+1]].
+    Searches run over these integer IDs and only turn them back into strings
+    for the final path. components[i] labels the connected component of word
+    i, so reachability between two words is a single comparison, and
+    landmarks holds the precomputed (landmark_id, distances) pairs used by
+    the ALT heuristic.
+    """
+
+    def __init__(self, length, words, offsets, targets, components=None, landmarks=None):
+        self.length = length
+        self.words = words
+        self.offsets = offsets
+        self.targets = targets
+        self._components = components
+        self._component_sizes = None
+        self._landmarks = landmarks
+
+    @classmethod
+    def build(cls, length, words):
+        """Build the graph for a sorted sequence of unique words of one length."""
+        buckets = {}
+        for word_id, word in enumerate(words):
+            for pattern in wildcard_patterns(word):
+                bucket = buckets.get(pattern)
+                if bucket is None:
+                    buckets[pattern] = [word_id]
+                else:
+                    bucket.append(word_id)
+
+        adjacency = [[] for _ in words]
+        for bucket in buckets.values():
+            if len(bucket) < 2:
+                continue
+            for word_id in bucket:
+                adjacency[word_id].extend(other for other in bucket if other != word_id)
+
+        offsets = array('I', [0])
+        targets = array('I')
+        for neighbors in adjacency:
+            neighbors.sort()
+            targets.extend(neighbors)
+            offsets.append(len(targets))
+
+        return cls(length, words, offsets, targets)
+
+    @property
+    def components(self):
+        if self._components is None:
+            self._components = label_components(len(self.words), self.offsets, self.targets)
+        return self._components
+
+    @property
+    def component_sizes(self):
+        """Number of words in each component, indexed by component label."""
+        if self._component_sizes is None:
+            components = self.components
+            sizes = array('I', [0]) * (max(components) + 1 if len(components) else 0)
+            for label in components:
+                sizes[label] += 1
+            self._component_sizes = sizes
+        return self._component_sizes
+
+    @property
+    def landmarks(self):
+        if self._landmarks is None:
+            self._landmarks = select_landmarks(self)
+        return self._landmarks
+
+    def __len__(self):
+        return len(self.words)
+
+    def index_of(self, word):
+        if len(word) != self.length:
+            return None
+        i = bisect_left(self.words, word)
+        if i < len(self.words) and self.words[i] == word:
+            return i
+        return None
+
+    def word_at(self, word_id):
+        return self.words[word_id]
+
+    def neighbors(self, word_id):
+        return self.targets[self.offsets[word_id]:self.offsets[word_id + 1]]
+
+    def degree(self, word_id):
+        return self.offsets[word_id + 1] - self.offsets[word_id]
+
+    def component_of(self, word_id):
+        return self.components[word_id]
+
+    def component_size(self, word_id):
+        return self.component_sizes[self.components[word_id]]
+
+    def are_connected(self, a, b):
+        return self.components[a] == self.components[b]
+
+    def distances_from(self, word_id, max_depth=None):
+        return bfs_distances(self, word_id, max_depth)
+
+    def to_words(self, word_ids):
+        return [self.words[word_id] for word_id in word_ids]
+
+
+def label_components(count, offsets, targets):
+    """Union-find over the CSR edges, returning dense component labels per word."""
+    parent = array('I', range(count))
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for node in range(count):
+        for neighbor in targets[offsets[node]:offsets[node + 1]]:
+            if neighbor > node:
+                root_a, root_b = find(node), find(neighbor)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    labels = array('I', [0]) * count
+    root_labels = {}
+    for node in range(count):
+        root = find(node)
+        label = root_labels.get(root)
+        if label is None:
+            label = root_labels[root] = len(root_labels)
+        labels[node] = label
+    return labels
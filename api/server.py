@@ -0,0 +1,212 @@
+"""HTTP service for solving ladders and giving hints.
+
+    python -m api.server --port 5000
+
+Each worker process loads the compiled dictionary once through
+get_shared_dictionary, and every request is answered from the same
+read-only index and the process-wide path cache. For several processes,
+run create_app() under any WSGI server, e.g. `gunicorn -w 4 'api.server:create_app()'`.
+
+Endpoints (parameters as a query string or a JSON body):
+
+    GET  /solve?start=COLD&target=WARM&algorithm=bfs
+    GET  /hint?current=CORD&target=WARM
+    GET  /neighbors?word=COLD
+    GET  /within?word=COLD&k=3
+    POST /solve_many  {"pairs": [["COLD", "WARM"], ...], "algorithm": "bfs"}
+    GET  /stats
+"""
+import argparse
+from functools import lru_cache
+import logging
+
+from flask import Flask, jsonify, request
+
+from algorithms.distance_map import distances_from
+from algorithms.landmarks import UNREACHABLE
+from algorithms.search_stats import SearchStats
+from ai.hint_system import HintSystem
+from game.game_logic import WordLadderGame
+from game.word_validator import is_valid_word
+from utils.dictionary_loader import DEFAULT_DICTIONARY_FILE, get_shared_dictionary
+
+DEFAULT_ALGORITHM = 'bidirectional_bfs'
+MAX_BATCH_SIZE = 1000
+MAX_WITHIN_STEPS = 10
+MAX_WITHIN_WORDS = 1000
+TARGET_DISTANCE_CACHE_SIZE = 256
+
+
+def _params():
+    params = dict(request.args)
+    if request.is_json:
+        params.update(request.get_json(silent=True) or {})
+    return params
+
+
+def _require(params, *names):
+    missing = [name for name in names if not params.get(name)]
+    if missing:
+        raise ValueError(f"Missing parameter: {', '.join(missing)}")
+    return [str(params[name]).upper() for name in names]
+
+
+def _check_words(index, *words):
+    if len({len(word) for word in words}) != 1:
+        raise ValueError("Words must have the same length")
+    for word in words:
+        if not is_valid_word(word, index):
+            raise ValueError(f"Not a valid word: {word}")
+
+
+def solve_pair(index, start_word, target_word, algorithm=DEFAULT_ALGORITHM):
+    """Solve one pair through WordLadderGame.find_path, so results are cached."""
+    start_word, target_word = start_word.upper(), target_word.upper()
+    _check_words(index, start_word, target_word)
+
+    result = {'start': start_word, 'target': target_word, 'algorithm': algorithm}
+    if not index.are_connected(start_word, target_word):
+        result.update(found=False, path=None, length=None, cached=False)
+        return result
+
+    game = WordLadderGame(dictionary=index, algorithm=algorithm)
+    path = game.find_path(start_word, target_word)
+    stats = game.algorithm_stats
+    result.update(
+        found=bool(path),
+        path=path,
+        length=len(path) - 1 if path else None,
+        cached=stats.get('cached', False),
+        time_ms=stats.get('time_ns', 0) / 1e6,
+        stats={name: stats[name] for name in SearchStats.__slots__ if name in stats}
+    )
+    for key in ('error', 'budget_exceeded'):
+        if key in stats:
+            result[key] = stats[key]
+    return result
+
+
+def create_app(dictionary_file=DEFAULT_DICTIONARY_FILE):
+    app = Flask(__name__)
+    index = get_shared_dictionary(dictionary_file).get_all_words()
+    hint_system = HintSystem(index)
+    default_game = WordLadderGame(dictionary=index)
+
+    @lru_cache(maxsize=TARGET_DISTANCE_CACHE_SIZE)
+    def target_distances(target_word):
+        graph = index.graph_for(target_word)
+        return graph.distances_from(graph.index_of(target_word))
+
+    @app.errorhandler(ValueError)
+    def bad_request(error):
+        return jsonify({'error': str(error)}), 400
+
+    @app.route('/solve', methods=['GET', 'POST'])
+    def solve():
+        params = _params()
+        start_word, target_word = _require(params, 'start', 'target')
+        algorithm = str(params.get('algorithm') or DEFAULT_ALGORITHM).lower()
+        return jsonify(solve_pair(index, start_word, target_word, algorithm))
+
+    @app.route('/hint', methods=['GET', 'POST'])
+    def hint():
+        current_word, target_word = _require(_params(), 'current', 'target')
+        _check_words(index, current_word, target_word)
+
+        distances = target_distances(target_word)
+        graph = index.graph_for(target_word)
+        distance = distances[graph.index_of(current_word)]
+        if distance == UNREACHABLE:
+            return jsonify({'current': current_word, 'target': target_word, 'hint': None, 'distance': None})
+
+        next_word = None
+        if distance > 0:
+            next_word = hint_system.get_next_move(current_word, target_word, None, distances)
+        return jsonify({
+            'current': current_word,
+            'target': target_word,
+            'hint': next_word,
+            'distance': distance,
+            'difficulty': hint_system.get_difficulty_hint((current_word, next_word)) if next_word else None
+        })
+
+    @app.route('/neighbors', methods=['GET', 'POST'])
+    def neighbors():
+        word, = _require(_params(), 'word')
+        if not is_valid_word(word, index):
+            raise ValueError(f"Not a valid word: {word}")
+        return jsonify({'word': word, 'neighbors': index.get_neighbors(word)})
+
+    @app.route('/within', methods=['GET', 'POST'])
+    def within():
+        params = _params()
+        word, = _require(params, 'word')
+        if not is_valid_word(word, index):
+            raise ValueError(f"Not a valid word: {word}")
+        try:
+            k = int(params.get('k', 3))
+        except (TypeError, ValueError):
+            raise ValueError("k must be an integer")
+        if not 1 <= k <= MAX_WITHIN_STEPS:
+            raise ValueError(f"k must be between 1 and {MAX_WITHIN_STEPS}")
+
+        distances = distances_from(word, index, max_depth=k)
+        words = distances.words_within(k)
+        histogram = distances.histogram()
+        histogram.pop(0, None)
+        return jsonify({
+            'word': word,
+            'k': k,
+            'count': len(words),
+            'by_distance': histogram,
+            'words': words[:MAX_WITHIN_WORDS]
+        })
+
+    @app.route('/solve_many', methods=['POST'])
+    def solve_many():
+        params = _params()
+        pairs = params.get('pairs')
+        if not isinstance(pairs, list):
+            raise ValueError("Expected a JSON body with a list of pairs")
+        if len(pairs) > MAX_BATCH_SIZE:
+            raise ValueError(f"At most {MAX_BATCH_SIZE} pairs per request")
+        algorithm = str(params.get('algorithm') or DEFAULT_ALGORITHM).lower()
+
+        results = []
+        for pair in pairs:
+            try:
+                if isinstance(pair, dict):
+                    start_word, target_word = pair['start'], pair['target']
+                else:
+                    start_word, target_word = pair
+                results.append(solve_pair(index, str(start_word), str(target_word), algorithm))
+            except (ValueError, KeyError, TypeError) as e:
+                results.append({'pair': pair, 'error': str(e)})
+        return jsonify({'algorithm': algorithm, 'results': results})
+
+    @app.route('/stats')
+    def stats():
+        return jsonify({
+            'words': len(index),
+            'fingerprint': index.fingerprint,
+            'path_cache': default_game.get_path_cache_stats(),
+            'target_distances': target_distances.cache_info()._asdict()
+        })
+
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m api.server', description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--dictionary', default=DEFAULT_DICTIONARY_FILE)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    app = create_app(args.dictionary)
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == '__main__':
+    main()
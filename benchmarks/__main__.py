@@ -0,0 +1,95 @@
+"""Reproducible solver benchmarks over the real dictionary.
+
+    python -m benchmarks run [--output results.json] [--pairs 3] [--seed 0]
+    python -m benchmarks compare baseline.json results.json [--threshold 0.2]
+
+`run` builds a seeded corpus of word pairs per word length (3-12) and
+ladder-distance bucket, including unreachable pairs, solves it with every
+AlgorithmFactory algorithm and writes p50/p95/p99 latency, nodes expanded
+and peak memory to JSON. `compare` exits with status 1 when any metric of
+the second report regresses past the threshold against the first.
+"""
+import argparse
+import sys
+
+from algorithms.algorithm_factory import AlgorithmFactory
+from benchmarks.corpus import DEFAULT_LENGTHS, build_corpus
+from benchmarks.runner import (
+    build_report, compare_reports, format_summary, load_report, run_benchmark, write_report
+)
+from utils.dictionary_loader import get_shared_dictionary
+
+
+def run_command(args):
+    index = get_shared_dictionary(args.dictionary).get_neighbor_index()
+    corpus = build_corpus(index, args.lengths, args.pairs, args.seed)
+    results = run_benchmark(index, corpus, args.algorithms,
+                            measure_memory=not args.no_memory, repeat=args.repeat)
+
+    settings = {
+        'lengths': args.lengths,
+        'pairs_per_bucket': args.pairs,
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'algorithms': args.algorithms or AlgorithmFactory.list_algorithms()
+    }
+    report = build_report(results, corpus, settings, index.fingerprint)
+    report['corpus'] = corpus
+    write_report(report, args.output)
+
+    print(format_summary(report))
+    print(f"\nWrote {args.output} ({len(corpus)} pairs)")
+    return 0
+
+
+def compare_command(args):
+    baseline = load_report(args.baseline)
+    current = load_report(args.current)
+
+    if baseline.get('dictionary_fingerprint') != current.get('dictionary_fingerprint'):
+        print("warning: reports were produced from different dictionaries")
+    if baseline.get('settings') != current.get('settings'):
+        print("warning: reports were produced with different settings")
+
+    regressions = compare_reports(baseline, current, args.threshold, group_latency=args.group_latency)
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%}")
+        return 0
+
+    for regression in regressions:
+        print(f"REGRESSION {regression['algorithm']:<18} {regression['scope']:<16} "
+              f"{regression['metric']:<20} {regression['baseline']:.3f} -> "
+              f"{regression['current']:.3f} ({regression['change']:+.0%})")
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='benchmark all algorithms and write a JSON report')
+    run_parser.add_argument('--dictionary', default='data/dictionary.txt')
+    run_parser.add_argument('--output', default='bench_results.json')
+    run_parser.add_argument('--lengths', type=int, nargs='+', default=DEFAULT_LENGTHS)
+    run_parser.add_argument('--pairs', type=int, default=3, help='pairs per length and distance bucket')
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--repeat', type=int, default=3, help='timed runs per pair, best is kept')
+    run_parser.add_argument('--algorithms', nargs='+', choices=AlgorithmFactory.list_algorithms())
+    run_parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc pass')
+    run_parser.set_defaults(handler=run_command)
+
+    compare_parser = commands.add_parser('compare', help='flag regressions against a baseline report')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help='allowed relative growth per metric (default 0.2)')
+    compare_parser.add_argument('--group-latency', action='store_true',
+                                help='also compare latency per length/bucket group')
+    compare_parser.set_defaults(handler=compare_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Compare A* with the plain Hamming heuristic against A* with ALT landmarks.
+
+    python -m benchmarks.alt_heuristic [--pairs 50] [--seed 7] [--lengths 4 5 6 7 8]
+
+For each word length a fixed, seeded set of connected pairs at least
+--min-distance steps apart is solved with both heuristics. Path lengths
+must agree (both are admissible); time and expanded nodes are reported.
+"""
+import argparse
+import random
+import time
+
+from algorithms.a_star import a_star_search
+from algorithms.bidirectional_bfs import bidirectional_bfs
+from algorithms.search_stats import SearchStats
+from utils.dictionary_loader import get_shared_dictionary
+
+
+def sample_pairs(graph, count, rng):
+    """Up to count random connected pairs of distinct words."""
+    words = graph.words
+    pairs = []
+    attempts = 0
+    while len(pairs) < count and attempts < count * 50:
+        attempts += 1
+        a, b = rng.randrange(len(words)), rng.randrange(len(words))
+        if a != b and graph.are_connected(a, b):
+            pairs.append((words[a], words[b]))
+    return pairs
+
+
+def run(index, lengths, pairs_per_length, min_distance, seed):
+    rng = random.Random(seed)
+    rows = []
+    for length in lengths:
+        graph = index.graph(length)
+
+        candidates = []
+        for start_word, target_word in sample_pairs(graph, pairs_per_length * 4, rng):
+            stats = bidirectional_bfs(start_word, target_word, index, stats_only=True)
+            if stats['found'] and stats['distance'] >= min_distance:
+                candidates.append((start_word, target_word))
+            if len(candidates) == pairs_per_length:
+                break
+
+        totals = {'hamming': [0.0, 0], 'alt': [0.0, 0]}
+        for start_word, target_word in candidates:
+            lengths_found = set()
+            for heuristic in totals:
+                stats = SearchStats()
+                started = time.perf_counter()
+                path = a_star_search(start_word, target_word, index, heuristic=heuristic, stats=stats)
+                totals[heuristic][0] += time.perf_counter() - started
+                totals[heuristic][1] += stats.nodes_expanded
+                lengths_found.add(len(path) if path else None)
+            if len(lengths_found) != 1:
+                raise AssertionError(f"Heuristics disagree on {start_word} -> {target_word}")
+
+        rows.append((length, len(candidates), totals))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dictionary', default='data/dictionary.txt')
+    parser.add_argument('--lengths', type=int, nargs='+', default=[4, 5, 6, 7, 8])
+    parser.add_argument('--pairs', type=int, default=50)
+    parser.add_argument('--min-distance', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    index = get_shared_dictionary(args.dictionary).get_neighbor_index()
+    rows = run(index, args.lengths, args.pairs, args.min_distance, args.seed)
+
+    print(f"{'len':>3} {'pairs':>5} {'hamming ms':>11} {'alt ms':>8} "
+          f"{'hamming exp':>12} {'alt exp':>9} {'exp ratio':>9}")
+    for length, count, totals in rows:
+        if not count:
+            continue
+        hamming_time, hamming_expanded = totals['hamming']
+        alt_time, alt_expanded = totals['alt']
+        print(f"{length:>3} {count:>5} {hamming_time / count * 1000:>11.2f} {alt_time / count * 1000:>8.2f} "
+              f"{hamming_expanded / count:>12.1f} {alt_expanded / count:>9.1f} "
+              f"{alt_expanded / max(hamming_expanded, 1):>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+import random
+
+from algorithms.landmarks import UNREACHABLE, bfs_distances
+
+DEFAULT_LENGTHS = list(range(3, 13))
+
+# Ladder-distance buckets as (name, lowest, highest) inclusive.
+DISTANCE_BUCKETS = [
+    ('1-2', 1, 2),
+    ('3-4', 3, 4),
+    ('5-7', 5, 7),
+    ('8+', 8, UNREACHABLE - 1),
+]
+UNREACHABLE_BUCKET = 'unreachable'
+
+
+def bucket_for(distance):
+    if distance is None:
+        return UNREACHABLE_BUCKET
+    for name, lowest, highest in DISTANCE_BUCKETS:
+        if lowest <= distance <= highest:
+            return name
+    return None
+
+
+def build_corpus(index, lengths=None, pairs_per_bucket=3, seed=0, max_sources=200):
+    """Fixed word pairs for every (length, distance bucket), reproducible from seed.
+
+    Sources are drawn at random; one BFS per source gives its distance to
+    every other word, and a target is picked at random from each bucket that
+    still needs pairs. Unreachable pairs take a target from another component.
+    """
+    rng = random.Random(seed)
+    pairs = []
+
+    for length in lengths or DEFAULT_LENGTHS:
+        graph = index.graph(length)
+        if len(graph) < 2:
+            continue
+
+        wanted = {name: pairs_per_bucket for name, _, _ in DISTANCE_BUCKETS}
+        wanted[UNREACHABLE_BUCKET] = pairs_per_bucket
+
+        for _ in range(max_sources):
+            if not any(wanted.values()):
+                break
+
+            source = rng.randrange(len(graph))
+            distances = bfs_distances(graph, source)
+            by_bucket = {}
+            for node, distance in enumerate(distances):
+                if node == source:
+                    continue
+                name = bucket_for(None if distance == UNREACHABLE else distance)
+                if name is not None and wanted.get(name):
+                    by_bucket.setdefault(name, []).append(node)
+
+            for name, candidates in sorted(by_bucket.items()):
+                target = rng.choice(candidates)
+                distance = distances[target]
+                pairs.append({
+                    'length': length,
+                    'bucket': name,
+                    'start': graph.word_at(source),
+                    'target': graph.word_at(target),
+                    'distance': None if distance == UNREACHABLE else distance
+                })
+                wanted[name] -= 1
+
+    return pairs
@@ -0,0 +1,120 @@
+"""Local load generator for the HTTP service in api.server.
+
+    python -m api.server --port 5000 &
+    python -m benchmarks.http_load --url http://127.0.0.1:5000 --endpoint mix --requests 2000 --concurrency 16
+
+Requests are built from the seeded benchmark corpus, so runs are
+repeatable. The report gives requests per second, latency percentiles
+and a count of response statuses.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import random
+import time
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+from benchmarks.corpus import build_corpus
+from benchmarks.runner import percentile
+from utils.dictionary_loader import get_shared_dictionary
+
+ENDPOINTS = ['solve', 'hint', 'neighbors', 'solve_many']
+
+
+def build_requests(corpus, endpoint, count, algorithm, batch_size, seed):
+    """Return count (method, path, body) tuples drawn from corpus pairs."""
+    rng = random.Random(seed)
+    pairs = [pair for pair in corpus if pair['distance'] is not None] or corpus
+    requests = []
+    for i in range(count):
+        name = ENDPOINTS[i % len(ENDPOINTS)] if endpoint == 'mix' else endpoint
+        pair = rng.choice(pairs)
+        if name == 'solve':
+            query = {'start': pair['start'], 'target': pair['target'], 'algorithm': algorithm}
+            requests.append(('GET', '/solve?' + urlencode(query), None))
+        elif name == 'hint':
+            query = {'current': pair['start'], 'target': pair['target']}
+            requests.append(('GET', '/hint?' + urlencode(query), None))
+        elif name == 'neighbors':
+            requests.append(('GET', '/neighbors?' + urlencode({'word': pair['start']}), None))
+        else:
+            batch = [[p['start'], p['target']] for p in rng.sample(pairs, min(batch_size, len(pairs)))]
+            requests.append(('POST', '/solve_many', {'pairs': batch, 'algorithm': algorithm}))
+    return requests
+
+
+def send(base_url, method, path, body, timeout):
+    data = json.dumps(body).encode() if body is not None else None
+    request = Request(base_url + path, data=data, method=method,
+                      headers={'Content-Type': 'application/json'} if data else {})
+    start_ns = time.perf_counter_ns()
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except HTTPError as e:
+        status = e.code
+    except (URLError, OSError) as e:
+        status = type(e).__name__
+    return status, (time.perf_counter_ns() - start_ns) / 1e6
+
+
+def run_load(base_url, requests, concurrency, timeout=30.0):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda r: send(base_url, *r, timeout), requests))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for _, latency in results]
+    statuses = {}
+    for status, _ in results:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    return {
+        'requests': len(results),
+        'concurrency': concurrency,
+        'seconds': elapsed,
+        'requests_per_second': len(results) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50),
+        'p95_ms': percentile(latencies, 0.95),
+        'p99_ms': percentile(latencies, 0.99),
+        'max_ms': max(latencies) if latencies else None,
+        'statuses': statuses
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.http_load', description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--endpoint', default='mix', choices=ENDPOINTS + ['mix'])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--algorithm', default='bidirectional_bfs')
+    parser.add_argument('--batch-size', type=int, default=20, help='pairs per /solve_many request')
+    parser.add_argument('--lengths', type=int, nargs='+', default=[3, 4, 5, 6, 7])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dictionary', default='data/dictionary.txt')
+    parser.add_argument('--output', help='also write the report as JSON')
+    args = parser.parse_args(argv)
+
+    index = get_shared_dictionary(args.dictionary).get_neighbor_index()
+    corpus = build_corpus(index, args.lengths, pairs_per_bucket=5, seed=args.seed)
+    requests = build_requests(corpus, args.endpoint, args.requests, args.algorithm, args.batch_size, args.seed)
+
+    report = run_load(args.url.rstrip('/'), requests, args.concurrency)
+    report['endpoint'] = args.endpoint
+    print(f"{report['requests']} requests in {report['seconds']:.2f}s "
+          f"({report['requests_per_second']:.0f} req/s, concurrency {args.concurrency})")
+    print(f"latency ms: p50 {report['p50_ms']:.2f}  p95 {report['p95_ms']:.2f}  "
+          f"p99 {report['p99_ms']:.2f}  max {report['max_ms']:.2f}")
+    print("statuses: " + ", ".join(f"{status}={count}" for status, count in sorted(report['statuses'].items())))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
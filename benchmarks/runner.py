@@ -0,0 +1,172 @@
+import json
+import math
+import platform
+import time
+import tracemalloc
+
+from algorithms.algorithm_factory import AlgorithmFactory
+from algorithms.search_stats import SearchStats
+
+# Metrics where a higher value in the current run counts as a regression.
+COMPARED_METRICS = [
+    'p50_ms', 'p95_ms', 'p99_ms', 'mean_nodes_expanded', 'mean_dictionary_probes',
+    'max_peak_frontier', 'peak_memory_kb'
+]
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _mean(samples, key):
+    return sum(sample[key] for sample in samples) / len(samples) if samples else None
+
+
+def _summarize(samples):
+    latencies = [sample['time_ms'] for sample in samples]
+    memory = [sample['peak_memory_kb'] for sample in samples if sample['peak_memory_kb'] is not None]
+    return {
+        'runs': len(samples),
+        'p50_ms': percentile(latencies, 0.50),
+        'p95_ms': percentile(latencies, 0.95),
+        'p99_ms': percentile(latencies, 0.99),
+        'mean_nodes_expanded': _mean(samples, 'nodes_expanded'),
+        'mean_nodes_generated': _mean(samples, 'nodes_generated'),
+        'mean_dictionary_probes': _mean(samples, 'dictionary_probes'),
+        'mean_stale_pops': _mean(samples, 'stale_pops'),
+        'max_peak_frontier': max(sample['peak_frontier'] for sample in samples) if samples else None,
+        'peak_memory_kb': max(memory) if memory else None,
+        'paths_found': sum(1 for sample in samples if sample['path_length'] is not None)
+    }
+
+
+def run_benchmark(index, corpus, algorithms=None, measure_memory=True, repeat=1):
+    """Solve every corpus pair with every algorithm and summarize the samples.
+
+    Latency comes from plain timed runs (best of repeat) without a stats
+    collector. Search counters and peak memory come from one separate run,
+    traced with tracemalloc unless measure_memory is off.
+    """
+    algorithms = algorithms or AlgorithmFactory.list_algorithms()
+
+    samples = {name: [] for name in algorithms}
+    for name in algorithms:
+        algorithm = AlgorithmFactory.create_algorithm(name)
+        for pair in corpus:
+            best_ns = None
+            for _ in range(max(1, repeat)):
+                start_ns = time.perf_counter_ns()
+                path = algorithm(pair['start'], pair['target'], index)
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                best_ns = elapsed_ns if best_ns is None else min(best_ns, elapsed_ns)
+
+            stats = SearchStats()
+            peak_memory_kb = None
+            if measure_memory:
+                tracemalloc.start()
+            algorithm(pair['start'], pair['target'], index, stats=stats)
+            if measure_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                peak_memory_kb = peak / 1024
+
+            sample = {
+                'length': pair['length'],
+                'bucket': pair['bucket'],
+                'time_ms': best_ns / 1e6,
+                'peak_memory_kb': peak_memory_kb,
+                'path_length': len(path) - 1 if path else None
+            }
+            sample.update(stats.as_dict())
+            samples[name].append(sample)
+
+    results = {}
+    for name, algorithm_samples in samples.items():
+        groups = {}
+        for sample in algorithm_samples:
+            groups.setdefault(f"{sample['length']}/{sample['bucket']}", []).append(sample)
+        results[name] = {
+            'overall': _summarize(algorithm_samples),
+            'groups': {key: _summarize(group) for key, group in sorted(groups.items())}
+        }
+    return results
+
+
+def build_report(results, corpus, settings, fingerprint):
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'dictionary_fingerprint': fingerprint,
+        'settings': settings,
+        'corpus_size': len(corpus),
+        'results': results
+    }
+
+
+def write_report(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_reports(baseline, current, threshold=0.2, min_ms=0.05, group_latency=False):
+    """Return a list of regressions of current against baseline.
+
+    A metric regresses when it grows by more than threshold (a fraction).
+    Latencies below min_ms in both runs are ignored as timer noise, and
+    latency is only compared per algorithm unless group_latency is set,
+    since the few pairs in a single length/bucket group are too noisy.
+    """
+    regressions = []
+    for name, current_result in current['results'].items():
+        baseline_result = baseline['results'].get(name)
+        if baseline_result is None:
+            continue
+
+        scopes = [('overall', baseline_result['overall'], current_result['overall'])]
+        for key, group in current_result['groups'].items():
+            if key in baseline_result['groups']:
+                scopes.append((key, baseline_result['groups'][key], group))
+
+        for scope, before, after in scopes:
+            for metric in COMPARED_METRICS:
+                old, new = before.get(metric), after.get(metric)
+                if old is None or new is None:
+                    continue
+                if metric.endswith('_ms'):
+                    if max(old, new) < min_ms or (scope != 'overall' and not group_latency):
+                        continue
+                if new > old * (1 + threshold):
+                    regressions.append({
+                        'algorithm': name,
+                        'scope': scope,
+                        'metric': metric,
+                        'baseline': old,
+                        'current': new,
+                        'change': (new - old) / old if old else float('inf')
+                    })
+    return regressions
+
+
+def format_summary(report):
+    lines = [f"{'algorithm':<18} {'runs':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+             f"{'nodes':>10} {'peak KB':>9} {'found':>6}"]
+    for name, result in report['results'].items():
+        overall = result['overall']
+        peak = overall['peak_memory_kb']
+        lines.append(
+            f"{name:<18} {overall['runs']:>5} {overall['p50_ms']:>9.3f} {overall['p95_ms']:>9.3f} "
+            f"{overall['p99_ms']:>9.3f} {overall['mean_nodes_expanded']:>10.1f} "
+            f"{(peak if peak is not None else 0):>9.1f} {overall['paths_found']:>6}"
+        )
+    return '\n'.join(lines)
@@ -1,15 +1,33 @@
-from algorithms.a_star import a_star_search
-from algorithms.bfs import bfs
-from algorithms.ucs import uniform_cost_search
-from algorithms.gbfs import greedy_best_first_search
-from game.word_validator import is_valid_word
+from concurrent.futures import ThreadPoolExecutor
+from algorithms.algorithm_factory import AlgorithmFactory
+from algorithms.landmarks import UNREACHABLE
+from algorithms.neighbor_index import get_neighbor_index
+from algorithms.parallel_comparison import (
+    COMPARISON_ALGORITHMS, DEFAULT_TIMEOUT, failed_result, run_comparison, solve
+)
+from algorithms.path_cache import get_path_cache
+from algorithms.search_budget import SearchBudget
+from algorithms.shortest_path_dag import build_shortest_path_dag
+from game.word_validator import is_neighbor, is_valid_word
 from ai.hint_system import HintSystem
+from utils.config import ALGORITHM_SETTINGS
+from utils.dictionary_loader import get_shared_dictionary
 import logging
-import time
+
+ALGORITHM_ALIASES = {'a*': 'a_star', 'bibfs': 'bidirectional_bfs'}
+
+# Work a game can do after it has started. A comparison can hold a worker
+# for up to its timeout, so it runs apart from the target distance map and
+# the shortest-path DAG, which take milliseconds and must never queue behind it.
+_comparisons = ThreadPoolExecutor(max_workers=4, thread_name_prefix='game-compare')
+_background = ThreadPoolExecutor(max_workers=4, thread_name_prefix='game-precompute')
 
 class WordLadderGame:
-    def __init__(self, dictionary, algorithm='bfs', max_moves=20, mode="Normal"):
-        self.dictionary = {word.upper() for word in dictionary}
+    def __init__(self, dictionary=None, algorithm='bfs', max_moves=20, mode="Normal", path_cache=None):
+        if dictionary is None:
+            dictionary = get_shared_dictionary().get_all_words()
+        # A reference to the shared read-only index, never a per-game copy.
+        self.dictionary = get_neighbor_index(dictionary)
         self.algorithm = algorithm.lower()
         self.max_moves = max_moves
         self.mode = mode
@@ -18,6 +36,11 @@ class WordLadderGame:
         self.current_word = None
         self.solution_path = None
         self.player_path = None
+        self.target_distances = None
+        self.algorithm_comparisons = None
+        self.comparison_future = None
+        self.distances_future = None
+        self.ladders_future = None
         self.moves_remaining = max_moves
         
         if mode == "Beginner":
@@ -31,71 +54,60 @@ class WordLadderGame:
         self.won = False
         self.hint_system = HintSystem(self.dictionary)
         self.algorithm_stats = {}
+        self.path_cache = path_cache if path_cache is not None else get_path_cache()
         
     def find_path(self, start_word, target_word):
-        algorithms = {
-            'bfs': bfs,
-            'a_star': a_star_search,
-            'a*': a_star_search,
-            'ucs': uniform_cost_search,
-            'gbfs': lambda s, t, d: greedy_best_first_search(s, t, d)
-        }
+        # Raises ValueError for an unknown algorithm name.
+        AlgorithmFactory.create_algorithm(self.algorithm)
         
-        if self.algorithm not in algorithms:
-            raise ValueError(f"Unknown algorithm: {self.algorithm}")
+        # Cached under the canonical name, so the comparison can reuse the result.
+        name = ALGORITHM_ALIASES.get(self.algorithm, self.algorithm)
+        fingerprint = self.dictionary.fingerprint
+        cached = self.path_cache.get(start_word, target_word, name, fingerprint)
+        if cached is not None:
+            self.algorithm_stats = dict(cached, name=self.algorithm)
+            return cached['path']
         
-        start_time = time.time()
         try:
-            path = algorithms[self.algorithm](start_word, target_word, self.dictionary)
-            end_time = time.time()
-            
-            self.algorithm_stats = {
-                'name': self.algorithm,
-                'time_taken': end_time - start_time,
-                'path_length': len(path) - 1 if path else None,
-                'path': path
-            }
+            result = solve(name, start_word, target_word, self.dictionary, budget=self.make_budget())
+            if 'budget_exceeded' not in result:
+                self.path_cache.put(start_word, target_word, name, fingerprint, result)
         except Exception as e:
             logging.error(f"Error running algorithm {self.algorithm}: {str(e)}")
-            path = None
-            self.algorithm_stats = {
-                'name': self.algorithm,
-                'time_taken': 0,
-                'path_length': None,
-                'path': None
-            }
+            result = failed_result(error=str(e))
             
-        return path
-        
-    def compare_algorithms(self, start_word, target_word):
-        algorithms = {
-            'bfs': bfs,
-            'a_star': a_star_search,
-            'ucs': uniform_cost_search,
-            'gbfs': lambda s, t, d: greedy_best_first_search(s, t, d)
-        }
+        self.algorithm_stats = dict(result, name=self.algorithm)
+        return result['path']
+
+    def make_budget(self):
+        """A fresh SearchBudget from the search_*_budget algorithm settings."""
+        return SearchBudget(
+            max_nodes=ALGORITHM_SETTINGS.get('search_node_budget'),
+            max_seconds=ALGORITHM_SETTINGS.get('search_time_budget')
+        )
+        
+    def compare_algorithms(self, start_word, target_word, timeout=None):
+        if timeout is None:
+            timeout = ALGORITHM_SETTINGS.get('comparison_timeout', DEFAULT_TIMEOUT)
         
+        fingerprint = self.dictionary.fingerprint
         results = {}
-        for name, algorithm in algorithms.items():
-            start_time = time.time()
-            try:
-                path = algorithm(start_word, target_word, self.dictionary)
-                end_time = time.time()
-                
-                results[name] = {
-                    'time_taken': end_time - start_time,
-                    'path_length': len(path) - 1 if path else None,
-                    'path': path
-                }
-            except Exception as e:
-                logging.error(f"Error running algorithm {name}: {str(e)}")
-                results[name] = {
-                    'time_taken': 0,
-                    'path_length': None,
-                    'path': None
-                }
+        pending = []
+        for name in COMPARISON_ALGORITHMS:
+            cached = self.path_cache.get(start_word, target_word, name, fingerprint)
+            if cached is not None:
+                results[name] = cached
+            else:
+                pending.append(name)
+        
+        if pending:
+            computed = run_comparison(start_word, target_word, self.dictionary, pending, timeout)
+            for name, result in computed.items():
+                results[name] = result
+                if not result.get('timed_out') and 'error' not in result and 'budget_exceeded' not in result:
+                    self.path_cache.put(start_word, target_word, name, fingerprint, result)
             
-        return results
+        return {name: results[name] for name in COMPARISON_ALGORITHMS}
 
     def start_game(self, start_word, end_word):
         start_word = start_word.upper()
@@ -107,22 +119,58 @@ class WordLadderGame:
         if not is_valid_word(start_word, self.dictionary) or not is_valid_word(end_word, self.dictionary):
             raise ValueError("Both words must be valid dictionary words")
 
-        self.algorithm_comparisons = self.compare_algorithms(start_word, end_word)
-        
+        if not self.dictionary.are_connected(start_word, end_word):
+            raise ValueError("No valid path exists between these words")
+
+        # Only the selected algorithm's path is needed to play; everything else
+        # is computed in the background while the player thinks.
         self.solution_path = self.find_path(start_word, end_word)
         if not self.solution_path:
+            if 'budget_exceeded' in self.algorithm_stats:
+                raise ValueError("The search ran out of its budget before finding a path")
             raise ValueError("No valid path exists between these words")
 
         self.start_word = start_word
         self.end_word = end_word
         self.current_word = start_word
         self.player_path = [start_word]
+        self.target_distances = None
+        self.algorithm_comparisons = None
         self.moves_remaining = self.max_moves
         self.game_over = False
         self.won = False
+        self.start_background_work()
         
         return True
 
+    def start_background_work(self):
+        """Submit the comparison, target distance map and optimal ladders as futures.
+
+        The selected algorithm's result is already in the path cache, so the
+        comparison does not search for it a second time.
+        """
+        self.comparison_future = _comparisons.submit(self.compare_algorithms, self.start_word, self.end_word)
+        self.distances_future = _background.submit(self._compute_target_distances, self.end_word)
+        self.ladders_future = _background.submit(build_shortest_path_dag, self.start_word, self.end_word,
+                                                 self.dictionary)
+
+    def _compute_target_distances(self, end_word):
+        graph = self.dictionary.graph_for(end_word)
+        return graph.distances_from(graph.index_of(end_word))
+
+    def comparison_ready(self):
+        return self.algorithm_comparisons is not None or (
+            self.comparison_future is not None and self.comparison_future.done()
+        )
+
+    def target_distances_ready(self):
+        return self.target_distances is not None or (
+            self.distances_future is not None and self.distances_future.done()
+        )
+
+    def optimal_ladders_ready(self):
+        return self.ladders_future is not None and self.ladders_future.done()
+
     def make_move(self, new_word):
         new_word = new_word.upper()
         
@@ -133,14 +181,13 @@ class WordLadderGame:
             self.game_over = True
             return False, "No moves remaining"
 
-        if new_word not in self.dictionary:
+        if not is_valid_word(new_word, self.dictionary):
             return False, "Not a valid word"
 
         if len(new_word) != len(self.current_word):
             return False, "Words must be the same length"
             
-        diff_count = sum(1 for a, b in zip(self.current_word, new_word) if a != b)
-        if diff_count != 1:
+        if not is_neighbor(self.current_word, new_word, self.dictionary):
             return False, "Must change exactly one letter"
 
         self.moves_remaining -= 1
@@ -156,7 +203,10 @@ class WordLadderGame:
             self.game_over = True
             return False, "Game Over - No moves remaining"
 
-        return True, f"Valid move! {self.moves_remaining} moves remaining"
+        # Waits for the target distance map if the background job has not
+        # finished yet; it takes milliseconds, so the message never varies.
+        track = "on an optimal track" if self.is_on_optimal_track() else "off the optimal track"
+        return True, f"Valid move! {self.moves_remaining} moves remaining ({track})"
 
     def get_hint(self):
         if self.hints_remaining <= 0:
@@ -168,7 +218,9 @@ class WordLadderGame:
         next_word = self.hint_system.get_next_move(
             self.current_word, 
             self.end_word, 
-            self.solution_path
+            self.solution_path,
+            self.get_target_distances(),
+            self.get_optimal_ladders()
         )
         
         if next_word:
@@ -180,6 +232,68 @@ class WordLadderGame:
         
         return None, "No hint available"
 
+    def get_target_distances(self):
+        """Distance from every word of the target's length to end_word.
+
+        Computed with one reverse BFS, normally in the background right after
+        start_game, and kept for the rest of the game, so hints and progress
+        checks need no search.
+        """
+        if self.target_distances is None and self.end_word:
+            future = self.distances_future
+            if future is not None:
+                try:
+                    self.target_distances = future.result()
+                except Exception as e:
+                    logging.error(f"Error computing target distances: {str(e)}")
+            if self.target_distances is None:
+                self.target_distances = self._compute_target_distances(self.end_word)
+        return self.target_distances
+
+    def get_optimal_ladders(self):
+        """ShortestPathDag of every optimal ladder from start_word to end_word, or None."""
+        if self.ladders_future is None:
+            return None
+        try:
+            return self.ladders_future.result()
+        except Exception as e:
+            logging.error(f"Error building optimal ladders: {str(e)}")
+            return None
+
+    def optimal_ladder_count(self):
+        ladders = self.get_optimal_ladders()
+        return ladders.count() if ladders is not None else None
+
+    def optimal_ladder_rank(self, path):
+        """1-based position of path among the optimal ladders, or None if it is not one."""
+        ladders = self.get_optimal_ladders()
+        if ladders is None or not path:
+            return None
+        rank = ladders.rank(path)
+        return rank + 1 if rank is not None else None
+
+    def distance_to_target(self, word):
+        distances = self.get_target_distances()
+        if distances is None:
+            return None
+        
+        word = word.upper()
+        graph = self.dictionary.graph_for(self.end_word)
+        word_id = graph.index_of(word)
+        if word_id is None or distances[word_id] == UNREACHABLE:
+            return None
+        return distances[word_id]
+
+    def is_on_optimal_track(self):
+        if not self.player_path:
+            return False
+        
+        optimal_moves = self.distance_to_target(self.start_word)
+        remaining = self.distance_to_target(self.current_word)
+        if optimal_moves is None or remaining is None:
+            return False
+        return len(self.player_path) - 1 + remaining == optimal_moves
+
     def get_graph_data(self, key=None):
         data = {
             'nodes': self.player_path.copy() if self.player_path else [],
@@ -193,10 +307,30 @@ class WordLadderGame:
             
         return data
         
-    def get_algorithm_comparison(self):
-        if not hasattr(self, 'algorithm_comparisons'):
+    def are_connected(self, word_a, word_b):
+        return self.dictionary.are_connected(word_a, word_b)
+
+    def get_path_cache_stats(self):
+        return self.path_cache.stats()
+
+    def get_algorithm_comparison(self, wait=True, timeout=None):
+        """The comparison results, waiting for the background run unless wait is False.
+
+        Returns None when no game has started, when wait is False and the
+        comparison is still running, or when it failed.
+        """
+        if self.algorithm_comparisons is not None:
+            return self.algorithm_comparisons
+        
+        future = self.comparison_future
+        if future is None or (not wait and not future.done()):
             return None
             
+        try:
+            self.algorithm_comparisons = future.result(timeout=timeout)
+        except Exception as e:
+            logging.error(f"Error comparing algorithms: {str(e)}")
+            return None
         return self.algorithm_comparisons
 
     def reset_game(self):
@@ -205,6 +339,14 @@ class WordLadderGame:
         self.current_word = None
         self.solution_path = None
         self.player_path = None
+        self.target_distances = None
+        self.algorithm_comparisons = None
+        for future in (self.comparison_future, self.distances_future, self.ladders_future):
+            if future is not None:
+                future.cancel()
+        self.comparison_future = None
+        self.distances_future = None
+        self.ladders_future = None
         self.moves_remaining = self.max_moves
         self.game_over = False
         self.won = False
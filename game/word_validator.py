@@ -1,16 +1,54 @@
-def is_valid_word(word, dictionary):
-    return word.upper() in dictionary or word.lower() in dictionary
+"""Word checks answered from the dictionary's NeighborIndex.
+
+Words are upper-cased once here and then looked up by binary search or read
+straight off the word's CSR adjacency, so every check costs time in
+proportion to its answer rather than to the size of the dictionary. Without
+a dictionary the process-wide shared one is used.
+"""
+from algorithms.neighbor_index import get_neighbor_index
+from utils.dictionary_loader import get_shared_dictionary
+
+
+def _index(dictionary):
+    if dictionary is None:
+        dictionary = get_shared_dictionary().get_all_words()
+    return get_neighbor_index(dictionary)
+
+
+def _lookup(word, dictionary):
+    """(graph, word_id) of word, or (graph, None) when it is not a dictionary word."""
+    word = word.upper()
+    graph = _index(dictionary).graph_for(word)
+    return graph, graph.index_of(word)
+
+
+def is_valid_word(word, dictionary=None):
+    return isinstance(word, str) and word.upper() in _index(dictionary)
 
 def is_one_letter_diff(word1, word2):
     if len(word1) != len(word2):
         return False
     return sum(c1 != c2 for c1, c2 in zip(word1.upper(), word2.upper())) == 1
 
+def is_neighbor(word_a, word_b, dictionary=None):
+    """True when both are dictionary words exactly one letter apart."""
+    word_a, word_b = word_a.upper(), word_b.upper()
+    if not is_one_letter_diff(word_a, word_b):
+        return False
+    index = _index(dictionary)
+    return word_a in index and word_b in index
+
+def neighbors(word, dictionary=None):
+    """Dictionary words one letter away from word, in sorted order."""
+    graph, word_id = _lookup(word, dictionary)
+    if word_id is None:
+        return []
+    return graph.to_words(graph.neighbors(word_id))
+
 def validate_transformation(start_word, end_word, dictionary):
     if not is_valid_word(start_word, dictionary) or not is_valid_word(end_word, dictionary):
         return False
     return True
 
 def find_valid_transformations(current_word, dictionary):
-    current_word = current_word.upper()
-    return [word for word in dictionary if is_one_letter_diff(current_word, word)]
\ No newline at end of file
+    return neighbors(current_word, dictionary)
@@ -1,7 +1,7 @@
 import sys
 from game.game_logic import WordLadderGame
 from ui.main_screen import main_screen
-from utils.dictionary_loader import DictionaryLoader
+from utils.dictionary_loader import get_shared_dictionary
 import logging
 
 def main():
@@ -9,7 +9,7 @@ def main():
 
     logging.info("Starting Word Ladder Adventure Game...")
     
-    dictionary_loader = DictionaryLoader('data/dictionary.txt')
+    dictionary_loader = get_shared_dictionary('data/dictionary.txt')
     words = dictionary_loader.get_all_words()
     logging.info(f"Dictionary loaded with {len(words)} words")
     
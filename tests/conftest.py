@@ -0,0 +1,9 @@
+import pytest
+
+from algorithms.neighbor_index import NeighborIndex
+from tests.helpers import WORDS
+
+
+@pytest.fixture
+def index():
+    return NeighborIndex(WORDS)
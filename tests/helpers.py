@@ -0,0 +1,37 @@
+# Small enough to check by brute force, with several optimal ladders between
+# some pairs, a second word length and a word with no neighbours at all.
+WORDS = [
+    'COLD', 'CORD', 'CARD', 'WARD', 'WARM', 'WORD', 'WORM', 'CORM',
+    'BOLD', 'BOLT', 'COLT', 'CART', 'WART', 'ZZZZ',
+    'CAT', 'COT', 'DOT', 'DOG', 'COG',
+]
+
+
+def one_letter_apart(word_a, word_b):
+    return len(word_a) == len(word_b) and sum(a != b for a, b in zip(word_a, word_b)) == 1
+
+
+def reference_distance(start, target):
+    """Ladder distance by plain BFS over WORDS, or None if target is unreachable."""
+    distances = {start: 0}
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for word in frontier:
+            if word == target:
+                return distances[word]
+            for neighbor in WORDS:
+                if neighbor not in distances and one_letter_apart(word, neighbor):
+                    distances[neighbor] = distances[word] + 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return None
+
+
+def word_pairs():
+    return [(start, target) for start in WORDS for target in WORDS if len(start) == len(target)]
+
+
+def is_ladder(path, start, target):
+    return (path[0] == start and path[-1] == target and all(word in WORDS for word in path)
+            and all(one_letter_apart(a, b) for a, b in zip(path, path[1:])))
@@ -0,0 +1,35 @@
+from algorithms.a_star import a_star_search
+from algorithms.landmarks import landmark_heuristic
+from tests.helpers import WORDS, is_ladder, reference_distance, word_pairs
+
+
+def test_landmark_bound_is_admissible(index):
+    for length in (3, 4):
+        graph = index.graph(length)
+        assert graph.landmarks
+        for target in range(len(graph)):
+            estimate = landmark_heuristic(graph.landmarks, target)
+            for node in range(len(graph)):
+                distance = reference_distance(graph.word_at(node), graph.word_at(target))
+                if distance is not None:
+                    assert estimate(node) <= distance, (graph.word_at(node), graph.word_at(target))
+
+
+def test_alt_a_star_finds_shortest_ladders(index):
+    for start, target in word_pairs():
+        expected = reference_distance(start, target)
+        path = a_star_search(start, target, index, heuristic='alt')
+        if expected is None:
+            assert path is None, (start, target)
+        else:
+            assert is_ladder(path, start, target), (start, target, path)
+            assert len(path) - 1 == expected, (start, target)
+
+
+def test_alt_agrees_with_hamming(index):
+    for start in WORDS:
+        for target in ('WARM', 'DOG'):
+            if len(start) == len(target):
+                alt = a_star_search(start, target, index, heuristic='alt')
+                hamming = a_star_search(start, target, index)
+                assert (alt and len(alt)) == (hamming and len(hamming)), (start, target)
@@ -0,0 +1,26 @@
+from algorithms.bfs import bfs
+from algorithms.bidirectional_bfs import bidirectional_bfs
+from tests.helpers import is_ladder, reference_distance, word_pairs
+
+
+def test_paths_are_shortest_ladders(index):
+    for start, target in word_pairs():
+        expected = reference_distance(start, target)
+        path = bidirectional_bfs(start, target, index)
+        if expected is None:
+            assert path is None, (start, target)
+        else:
+            assert is_ladder(path, start, target), (start, target, path)
+            assert len(path) - 1 == expected == len(bfs(start, target, index)) - 1, (start, target)
+
+
+def test_stats_only_distance_matches_bfs(index):
+    for start, target in word_pairs():
+        stats = bidirectional_bfs(start, target, index, stats_only=True)
+        assert stats['found'] == (reference_distance(start, target) is not None)
+        assert stats['distance'] == bfs(start, target, index, stats_only=True)['distance'], (start, target)
+
+
+def test_unknown_words_have_no_path(index):
+    assert bidirectional_bfs('COLD', 'XXXX', index) is None
+    assert bidirectional_bfs('XXXX', 'COLD', index) is None
@@ -0,0 +1,35 @@
+from algorithms.word_graph import label_components
+from tests.helpers import WORDS, reference_distance, word_pairs
+
+
+def test_are_connected_matches_reachability(index):
+    for start, target in word_pairs():
+        assert index.are_connected(start, target) == (reference_distance(start, target) is not None), \
+            (start, target)
+
+
+def test_isolated_and_unknown_words(index):
+    assert index.are_connected('ZZZZ', 'ZZZZ')
+    for word in WORDS:
+        if word != 'ZZZZ':
+            assert not index.are_connected(word, 'ZZZZ')
+            assert not index.are_connected('ZZZZ', word)
+    assert not index.are_connected('COLD', 'XXXX')
+    assert not index.are_connected('COLD', 'CAT')
+
+
+def test_component_sizes(index):
+    graph = index.graph(4)
+    assert graph.component_size(graph.index_of('ZZZZ')) == 1
+    assert graph.component_size(graph.index_of('COLD')) == 13
+    assert sum(graph.component_sizes) == len(graph)
+
+
+def test_label_components_are_dense():
+    # 0-1-2 and 3-4 connected, 5 on its own.
+    edges = {0: [1], 1: [0, 2], 2: [1], 3: [4], 4: [3], 5: []}
+    offsets, targets = [0], []
+    for node in range(6):
+        targets.extend(edges[node])
+        offsets.append(len(targets))
+    assert list(label_components(6, offsets, targets)) == [0, 0, 0, 1, 1, 2]
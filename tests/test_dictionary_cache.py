@@ -0,0 +1,68 @@
+import hashlib
+
+from utils.dictionary_cache import load_compiled_dictionary, read_cache, write_cache
+from tests.helpers import WORDS
+
+DIGEST = hashlib.sha256(b'test words').digest()
+
+
+def test_round_trip(index, tmp_path):
+    cache_path = tmp_path / 'dictionary.bin'
+    write_cache(index, str(cache_path), DIGEST)
+    loaded = read_cache(str(cache_path), DIGEST)
+
+    assert loaded is not None
+    assert loaded.fingerprint == DIGEST.hex()
+    assert sorted(loaded.lengths()) == sorted(index.lengths())
+    for length in index.lengths():
+        original, mapped = index.graph(length), loaded.graph(length)
+        assert list(mapped.words) == list(original.words)
+        assert list(mapped.offsets) == list(original.offsets)
+        assert list(mapped.targets) == list(original.targets)
+        assert list(mapped.components) == list(original.components)
+        assert [(landmark, bytes(distances)) for landmark, distances in mapped.landmarks] == \
+               [(landmark, bytes(distances)) for landmark, distances in original.landmarks]
+    for word in WORDS:
+        assert word in loaded
+        assert loaded.get_neighbors(word) == index.get_neighbors(word)
+    assert loaded.are_connected('COLD', 'WARM')
+    assert not loaded.are_connected('COLD', 'ZZZZ')
+
+
+def test_stale_digest_is_rejected(index, tmp_path):
+    cache_path = tmp_path / 'dictionary.bin'
+    write_cache(index, str(cache_path), DIGEST)
+    assert read_cache(str(cache_path), hashlib.sha256(b'other words').digest()) is None
+    assert read_cache(str(tmp_path / 'missing.bin'), DIGEST) is None
+
+
+def test_truncated_cache_is_rejected(index, tmp_path):
+    cache_path = tmp_path / 'dictionary.bin'
+    write_cache(index, str(cache_path), DIGEST)
+    size = cache_path.stat().st_size
+    for truncated in (size - 1, size // 2, 60):
+        with open(cache_path, 'r+b') as f:
+            f.truncate(truncated)
+        assert read_cache(str(cache_path), DIGEST) is None
+
+
+def test_load_compiles_then_reuses_the_cache(tmp_path):
+    dictionary_file = tmp_path / 'words.txt'
+    dictionary_file.write_text('\n'.join(WORDS) + '\n')
+    cache_path = tmp_path / 'words.bin'
+
+    compiled = load_compiled_dictionary(str(dictionary_file))
+    assert cache_path.exists()
+    fingerprint, neighbors = compiled.fingerprint, compiled.get_neighbors('COLD')
+    assert neighbors == ['BOLD', 'COLT', 'CORD']
+    reloaded = load_compiled_dictionary(str(dictionary_file))
+    assert reloaded.fingerprint == fingerprint
+    assert reloaded.get_neighbors('COLD') == neighbors
+    # Both still map the file that is about to be cut short.
+    del compiled, reloaded
+
+    with open(cache_path, 'r+b') as f:
+        f.truncate(cache_path.stat().st_size // 2)
+    rebuilt = load_compiled_dictionary(str(dictionary_file))
+    assert rebuilt.get_neighbors('COLD') == neighbors
+    assert read_cache(str(cache_path), bytes.fromhex(fingerprint)) is not None
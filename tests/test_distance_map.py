@@ -0,0 +1,57 @@
+import pytest
+
+from algorithms.bfs import bfs
+from algorithms.distance_map import distances_from
+from algorithms.landmarks import UNREACHABLE
+from utils.word_generator import RandomWordGenerator
+from tests.helpers import WORDS, reference_distance
+
+
+def test_distances_match_reference_bfs(index):
+    for source in WORDS:
+        distances = distances_from(source, index)
+        for word in WORDS:
+            expected = reference_distance(source, word) if len(word) == len(source) else None
+            assert distances.distance_to(word) == expected, (source, word)
+
+
+def test_words_at_within_and_histogram(index):
+    distances = distances_from('cold', index)
+    assert distances.source_word == 'COLD'
+    assert distances.words_at(0) == ['COLD']
+    assert distances.words_at(1) == ['BOLD', 'COLT', 'CORD']
+    assert distances.words_at(UNREACHABLE) == []
+    within = distances.words_within(2)
+    assert within == sorted(word for word in WORDS if len(word) == 4 and 1 <= (reference_distance('COLD', word) or 0) <= 2)
+    assert distances.count_within(2) == len(within)
+    histogram = distances.histogram()
+    assert sum(histogram.values()) == 13
+    assert max(histogram) == distances.eccentricity()
+
+
+def test_max_depth_stops_the_search(index):
+    distances = distances_from('COLD', index, max_depth=1)
+    assert distances.distance_to('CORD') == 1
+    assert distances.distance_to('CARD') is None
+    assert distances_from('XXXX', index) is None
+
+
+def test_find_pair_returns_the_requested_distance(index):
+    generator = RandomWordGenerator(index)
+    for distance in range(1, 5):
+        # Not every randomly drawn start has a word that far away, so None is allowed.
+        pairs = [generator.find_pair('easy', distance=distance) for _ in range(20)]
+        pairs = [pair for pair in pairs if pair is not None]
+        assert pairs, distance
+        for start, end, found in pairs:
+            assert found == distance
+            assert bfs(start, end, index, stats_only=True)['distance'] == distance
+
+
+def test_find_pair_cannot_meet_an_impossible_distance(index):
+    generator = RandomWordGenerator(index)
+    assert generator.find_pair('easy', distance=30) is None
+    assert generator.get_random_pair('easy', distance=30) == (None, None)
+    for distance in (0, UNREACHABLE, 300):
+        with pytest.raises(ValueError):
+            generator.find_pair('easy', distance=distance)
@@ -0,0 +1,20 @@
+from algorithms.neighbor_index import NeighborIndex, clear_neighbor_index_cache, get_neighbor_index
+from tests.helpers import WORDS
+
+
+def test_index_is_built_once_per_dictionary_object():
+    for dictionary in (set(WORDS), list(WORDS), dict.fromkeys(WORDS)):
+        index = get_neighbor_index(dictionary)
+        assert isinstance(index, NeighborIndex)
+        assert get_neighbor_index(dictionary) is index
+        assert 'COLD' in index
+
+    words = list(WORDS)
+    index = get_neighbor_index(words)
+    clear_neighbor_index_cache()
+    assert get_neighbor_index(words) is not index
+    clear_neighbor_index_cache()
+
+
+def test_neighbor_index_is_passed_through(index):
+    assert get_neighbor_index(index) is index
@@ -0,0 +1,71 @@
+from algorithms.path_cache import PathCache
+
+
+def result(*path):
+    return {'path': list(path), 'nodes_expanded': len(path)}
+
+
+def test_forward_hit_returns_a_copy():
+    cache = PathCache()
+    cache.put('COLD', 'WARM', 'bfs', 'f1', result('COLD', 'CORD', 'CARD', 'WARD', 'WARM'))
+
+    hit = cache.get('COLD', 'WARM', 'bfs', 'f1')
+    assert hit['path'] == ['COLD', 'CORD', 'CARD', 'WARD', 'WARM']
+    assert hit['cached'] is True
+    hit['path'].append('XXXX')
+    assert cache.get('COLD', 'WARM', 'bfs', 'f1')['path'][-1] == 'WARM'
+    assert cache.stats()['reverse_hits'] == 0
+
+
+def test_reverse_hit_reverses_the_path():
+    cache = PathCache()
+    cache.put('COLD', 'WARM', 'bfs', 'f1', result('COLD', 'CORD', 'CARD', 'WARD', 'WARM'))
+
+    hit = cache.get('WARM', 'COLD', 'bfs', 'f1')
+    assert hit['path'] == ['WARM', 'WARD', 'CARD', 'CORD', 'COLD']
+    stats = cache.stats()
+    assert (stats['hits'], stats['reverse_hits'], stats['misses']) == (1, 1, 0)
+
+
+def test_keys_include_algorithm_and_fingerprint():
+    cache = PathCache()
+    cache.put('COLD', 'WARM', 'bfs', 'f1', result('COLD', 'WARM'))
+    assert cache.get('COLD', 'WARM', 'ucs', 'f1') is None
+    assert cache.get('COLD', 'WARM', 'bfs', 'f2') is None
+    assert cache.stats()['misses'] == 2
+
+
+def test_no_path_results_are_cached():
+    cache = PathCache()
+    cache.put('COLD', 'ZZZZ', 'bfs', 'f1', {'path': None})
+    assert cache.get('ZZZZ', 'COLD', 'bfs', 'f1')['path'] is None
+
+
+def test_lru_eviction():
+    cache = PathCache(max_size=2)
+    cache.put('A', 'B', 'bfs', 'f1', result('A', 'B'))
+    cache.put('C', 'D', 'bfs', 'f1', result('C', 'D'))
+    # A reverse hit refreshes the entry it was answered from.
+    assert cache.get('B', 'A', 'bfs', 'f1') is not None
+    cache.put('E', 'F', 'bfs', 'f1', result('E', 'F'))
+
+    assert len(cache) == 2
+    assert cache.stats()['evictions'] == 1
+    assert cache.get('C', 'D', 'bfs', 'f1') is None
+    assert cache.get('A', 'B', 'bfs', 'f1') is not None
+    assert cache.get('F', 'E', 'bfs', 'f1')['path'] == ['F', 'E']
+
+
+def test_invalidate_by_fingerprint():
+    cache = PathCache()
+    cache.put('A', 'B', 'bfs', 'f1', result('A', 'B'))
+    cache.put('A', 'B', 'bfs', 'f2', result('A', 'B'))
+    cache.invalidate('f1')
+    assert cache.get('A', 'B', 'bfs', 'f1') is None
+    assert cache.get('A', 'B', 'bfs', 'f2') is not None
+
+
+def test_zero_size_disables_caching():
+    cache = PathCache(max_size=0)
+    cache.put('A', 'B', 'bfs', 'f1', result('A', 'B'))
+    assert len(cache) == 0
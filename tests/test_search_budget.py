@@ -0,0 +1,49 @@
+import pytest
+
+from algorithms.a_star import a_star_search
+from algorithms.bfs import bfs
+from algorithms.bidirectional_bfs import bidirectional_bfs
+from algorithms.gbfs import greedy_best_first_search
+from algorithms.parallel_comparison import solve
+from algorithms.search_budget import BudgetExceeded, CancellationToken, SearchBudget
+from algorithms.ucs import uniform_cost_search
+
+SOLVERS = [bfs, bidirectional_bfs, a_star_search, uniform_cost_search, greedy_best_first_search]
+
+
+@pytest.mark.parametrize('solver', SOLVERS, ids=lambda solver: solver.__name__)
+def test_node_budget_stops_the_search(solver, index):
+    result = solver('COLD', 'WARM', index, budget=SearchBudget(max_nodes=1))
+    assert isinstance(result, BudgetExceeded)
+    assert not result
+    assert result.reason == 'nodes'
+    assert result.nodes_expanded == 1
+
+
+@pytest.mark.parametrize('solver', SOLVERS, ids=lambda solver: solver.__name__)
+def test_large_enough_budget_finds_the_ladder(solver, index):
+    path = solver('COLD', 'WARM', index, budget=SearchBudget(max_nodes=1000))
+    assert path[0] == 'COLD' and path[-1] == 'WARM'
+
+
+def test_cancelled_token_stops_the_search(index):
+    token = CancellationToken()
+    token.cancel()
+    result = bfs('COLD', 'WARM', index, budget=SearchBudget(token=token))
+    assert isinstance(result, BudgetExceeded)
+    assert result.reason == 'cancelled'
+    assert result.nodes_expanded == 0
+
+
+def test_stats_only_reports_the_exhausted_limit(index):
+    for solver in (bfs, bidirectional_bfs):
+        stats = solver('COLD', 'WARM', index, stats_only=True, budget=SearchBudget(max_nodes=1))
+        assert not stats['found']
+        assert stats['budget_exceeded'] == 'nodes'
+
+
+def test_solve_marks_budget_exceeded(index):
+    result = solve('bfs', 'COLD', 'WARM', index, budget=SearchBudget(max_nodes=1))
+    assert result['path'] is None
+    assert result['budget_exceeded'] == 'nodes'
+    assert 'budget_exceeded' not in solve('bfs', 'COLD', 'WARM', index)
@@ -0,0 +1,68 @@
+from algorithms.shortest_path_dag import build_shortest_path_dag
+from tests.helpers import WORDS, one_letter_apart
+
+
+def brute_force_ladders(start, target):
+    """Every shortest ladder from start to target, found by trying all simple paths."""
+    ladders = []
+    stack = [[start]]
+    while stack:
+        path = stack.pop()
+        if path[-1] == target:
+            ladders.append(path)
+            continue
+        for word in WORDS:
+            if word not in path and one_letter_apart(path[-1], word):
+                stack.append(path + [word])
+    if not ladders:
+        return []
+    shortest = min(len(ladder) for ladder in ladders)
+    return sorted(ladder for ladder in ladders if len(ladder) == shortest)
+
+
+def test_count_and_ladders_match_brute_force(index):
+    for start in WORDS:
+        for target in WORDS:
+            if len(start) != len(target):
+                continue
+            expected = brute_force_ladders(start, target)
+            dag = build_shortest_path_dag(start, target, index)
+            assert dag.count() == len(expected), (start, target)
+            assert list(dag.ladders()) == expected, (start, target)
+            if expected:
+                assert dag.distance == len(expected[0]) - 1
+
+
+def test_rank_is_position_in_ladders(index):
+    dag = build_shortest_path_dag('COLD', 'WARM', index)
+    expected = brute_force_ladders('COLD', 'WARM')
+    assert len(expected) > 1
+    for position, ladder in enumerate(expected):
+        assert dag.rank(ladder) == position
+        assert dag.rank([word.lower() for word in ladder]) == position
+
+
+def test_rank_rejects_ladders_that_are_not_shortest(index):
+    dag = build_shortest_path_dag('COLD', 'WARM', index)
+    assert dag.rank(['COLD', 'CORD', 'WORD', 'WORM', 'WARM']) is not None
+    assert dag.rank(['COLD', 'BOLD', 'BOLT', 'COLT']) is None
+    assert dag.rank(['COLD', 'CORD', 'CARD', 'CART', 'WART', 'WARD', 'WARM']) is None
+    assert dag.rank([]) is None
+
+
+def test_unreachable_and_unknown_words(index):
+    dag = build_shortest_path_dag('COLD', 'ZZZZ', index)
+    assert dag.count() == 0
+    assert list(dag.ladders()) == []
+    assert dag.distance is None
+    assert build_shortest_path_dag('COLD', 'XXXX', index) is None
+    assert build_shortest_path_dag('COLD', 'CAT', index) is None
+
+
+def test_paths_through(index):
+    dag = build_shortest_path_dag('COLD', 'WARM', index)
+    graph = dag.graph
+    expected = brute_force_ladders('COLD', 'WARM')
+    for word in ('CORD', 'WORD', 'CARD', 'WARM'):
+        through = sum(word in ladder for ladder in expected)
+        assert dag.paths_through(graph.index_of(word)) == through
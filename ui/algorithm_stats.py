@@ -1,10 +1,25 @@
+import io
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
+from ui.render_cache import RenderCache, content_key
+
+COLORS = ['blue', 'green', 'red', 'purple', 'orange']
+
+# Search counters shown as extra panels when the comparison carries them.
+SEARCH_PANELS = [
+    ('nodes_expanded', 'Nodes Expanded', 'Nodes'),
+    ('nodes_generated', 'Nodes Generated', 'Nodes'),
+    ('peak_frontier', 'Peak Frontier Size', 'Entries'),
+    ('dictionary_probes', 'Neighbor Probes', 'Probes'),
+]
+
+# Rendered charts by content, so reruns and other sessions with the same
+# comparison skip matplotlib entirely.
+comparison_cache = RenderCache(max_size=64)
 
 class AlgorithmVisualizer:
     @staticmethod
-    def show_algorithm_comparison(algorithm_stats):
+    def show_algorithm_comparison(algorithm_stats, image_format='png'):
+        """The comparison chart as PNG bytes (or SVG text), or None without data."""
         if not algorithm_stats:
             st.warning("No algorithm data available for comparison")
             return None
@@ -28,9 +43,33 @@ class AlgorithmVisualizer:
             st.warning("No valid algorithm comparison data available")
             return None
             
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        panels = [
+            (key, title, label) for key, title, label in SEARCH_PANELS
+            if all(algorithm_stats[algo].get(key) is not None for algo in valid_algorithms)
+        ]
+        
+        shown = tuple(
+            (algo, time_taken, path_length) + tuple(algorithm_stats[algo][key] for key, _, _ in panels)
+            for algo, time_taken, path_length in zip(valid_algorithms, times, path_lengths)
+        )
+        key = content_key('comparison', image_format, tuple(key for key, _, _ in panels), shown)
+        return comparison_cache.get_or_render(key, lambda: AlgorithmVisualizer._render(
+            algorithm_stats, valid_algorithms, times, path_lengths, panels, image_format
+        ))
+
+    @staticmethod
+    def _render(algorithm_stats, valid_algorithms, times, path_lengths, panels, image_format):
+        # Imported here so matplotlib is only loaded once a comparison is shown.
+        from matplotlib.figure import Figure
+        
+        rows = 1 + (len(panels) + 1) // 2
+        colors = COLORS[:len(valid_algorithms)]
+        
+        fig = Figure(figsize=(12, 5 * rows))
+        axes = fig.subplots(rows, 2, squeeze=False)
+        ax1, ax2 = axes[0]
         
-        bars1 = ax1.bar(valid_algorithms, times, color=['blue', 'green', 'red', 'purple'][:len(valid_algorithms)])
+        bars1 = ax1.bar(valid_algorithms, times, color=colors)
         ax1.set_title('Execution Time Comparison')
         ax1.set_ylabel('Time (seconds)')
         ax1.set_xlabel('Algorithm')
@@ -43,7 +82,7 @@ class AlgorithmVisualizer:
                     f'{height:.4f}s',
                     ha='center', va='bottom', rotation=0)
         
-        bars2 = ax2.bar(valid_algorithms, path_lengths, color=['blue', 'green', 'red', 'purple'][:len(valid_algorithms)])
+        bars2 = ax2.bar(valid_algorithms, path_lengths, color=colors)
         ax2.set_title('Path Length Comparison')
         ax2.set_ylabel('Path Length')
         ax2.set_xlabel('Algorithm')
@@ -54,5 +93,25 @@ class AlgorithmVisualizer:
                     f'{int(height)}',
                     ha='center', va='bottom', rotation=0)
         
-        plt.tight_layout()
-        return fig
\ No newline at end of file
+        panel_axes = list(axes[1:].flat)
+        for ax, (key, title, label) in zip(panel_axes, panels):
+            values = [algorithm_stats[algo][key] for algo in valid_algorithms]
+            bars = ax.bar(valid_algorithms, values, color=colors)
+            ax.set_title(title)
+            ax.set_ylabel(label)
+            ax.set_xlabel('Algorithm')
+            for bar in bars:
+                height = bar.get_height()
+                ax.text(bar.get_x() + bar.get_width()/2., height,
+                        f'{int(height)}',
+                        ha='center', va='bottom', rotation=0)
+        
+        for ax in panel_axes[len(panels):]:
+            ax.axis('off')
+        
+        fig.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=image_format)
+        if image_format == 'svg':
+            return buffer.getvalue().decode('utf-8')
+        return buffer.getvalue()
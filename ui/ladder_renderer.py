@@ -0,0 +1,166 @@
+"""Pure-Python SVG drawing of a word ladder, rendered in memory.
+
+The player's words run left to right in the order they were first reached;
+words only on the solution path sit on a second row under the step where the
+solution uses them. Player moves are solid blue arrows and solution steps the
+player did not take are dashed red ones. Colours follow the old graphviz
+drawing: start green, current word blue, solution-only words yellow.
+"""
+import math
+from xml.sax.saxutils import escape
+
+from ui.render_cache import RenderCache, content_key
+
+NODE_HEIGHT = 30
+CHAR_WIDTH = 11
+NODE_PADDING = 24
+COLUMN_GAP = 40
+ROW_GAP = 50
+MARGIN = 20
+ARC_SPACE = 40
+FONT = 'Arial, Helvetica, sans-serif'
+
+PLAYER_EDGE = 'blue'
+SOLUTION_EDGE = 'red'
+FILLS = {'start': 'lightgreen', 'current': 'lightblue', 'path': 'white', 'solution': 'lightyellow'}
+
+shared_ladder_cache = RenderCache()
+
+
+class LadderLayout:
+    """Grid positions of the player's words, extended move by move.
+
+    A word's column is the number of distinct words reached before it, so a
+    new move only places the new word and nothing already drawn moves.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.player_path = []
+        self.columns = {}
+
+    def update(self, player_path):
+        player_path = list(player_path)
+        if player_path[:len(self.player_path)] != self.player_path:
+            self.reset()
+        for word in player_path[len(self.player_path):]:
+            if word not in self.columns:
+                self.columns[word] = len(self.columns)
+        self.player_path = player_path
+        return self.columns
+
+    def positions(self, solution_path=()):
+        """(column, row) of every word to draw; solution-only words go on row 1."""
+        positions = {word: (column, 0) for word, column in self.columns.items()}
+        for step, word in enumerate(solution_path):
+            if word not in positions:
+                positions[word] = (step, 1)
+        return positions
+
+
+class LadderRenderer:
+    """Per-session renderer over a process-wide cache of finished SVGs."""
+
+    def __init__(self, cache=None):
+        self.layout = LadderLayout()
+        self.cache = cache if cache is not None else shared_ladder_cache
+
+    def render(self, player_path, solution_path=None):
+        """SVG text for the ladder, reused from the cache for identical paths."""
+        player_path = tuple(player_path or ())
+        solution_path = tuple(solution_path or ())
+        if not player_path:
+            return None
+        key = content_key('ladder', player_path, solution_path)
+        return self.cache.get_or_render(key, lambda: self._render(player_path, solution_path))
+
+    def _render(self, player_path, solution_path):
+        self.layout.update(player_path)
+        positions = self.layout.positions(solution_path)
+        node_width = CHAR_WIDTH * max(len(word) for word in positions) + NODE_PADDING
+
+        columns = max(column for column, _ in positions.values()) + 1
+        rows = max(row for _, row in positions.values()) + 1
+        width = 2 * MARGIN + columns * node_width + (columns - 1) * COLUMN_GAP
+        height = 2 * MARGIN + 2 * ARC_SPACE + rows * NODE_HEIGHT + (rows - 1) * ROW_GAP
+
+        def center(word):
+            column, row = positions[word]
+            x = MARGIN + column * (node_width + COLUMN_GAP) + node_width / 2
+            y = MARGIN + ARC_SPACE + row * (NODE_HEIGHT + ROW_GAP) + NODE_HEIGHT / 2
+            return x, y
+
+        player_edges = list(dict.fromkeys(zip(player_path, player_path[1:])))
+        taken = set(player_edges)
+        solution_edges = [edge for edge in zip(solution_path, solution_path[1:])
+                          if edge not in taken and edge[::-1] not in taken]
+
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+            f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="{FONT}" font-size="14">',
+            '<defs>',
+            _marker('arrow-player', PLAYER_EDGE),
+            _marker('arrow-solution', SOLUTION_EDGE),
+            '</defs>'
+        ]
+        for a, b in player_edges:
+            parts.append(_edge(center(a), center(b), positions[a], positions[b], node_width,
+                               PLAYER_EDGE, 'arrow-player'))
+        for a, b in solution_edges:
+            parts.append(_edge(center(a), center(b), positions[a], positions[b], node_width,
+                               SOLUTION_EDGE, 'arrow-solution', dashed=True))
+
+        current = player_path[-1]
+        for word in positions:
+            if word == player_path[0]:
+                kind = 'start'
+            elif word == current:
+                kind = 'current'
+            elif word in self.layout.columns:
+                kind = 'path'
+            else:
+                kind = 'solution'
+            x, y = center(word)
+            parts.append(
+                f'<rect x="{x - node_width / 2:.1f}" y="{y - NODE_HEIGHT / 2:.1f}" width="{node_width}" '
+                f'height="{NODE_HEIGHT}" fill="{FILLS[kind]}" stroke="black"/>'
+                f'<text x="{x:.1f}" y="{y + 5:.1f}" text-anchor="middle">{escape(word)}</text>'
+            )
+        parts.append('</svg>')
+        return ''.join(parts)
+
+
+def _marker(marker_id, color):
+    return (f'<marker id="{marker_id}" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="7" '
+            f'markerHeight="7" orient="auto-start-reverse"><path d="M0,0 L10,5 L0,10 z" fill="{color}"/></marker>')
+
+
+def _edge(start, end, start_cell, end_cell, node_width, color, marker, dashed=False):
+    """A straight arrow between neighbouring cells, otherwise an arc clear of the row."""
+    dash = ' stroke-dasharray="6,4"' if dashed else ''
+    (x1, y1), (x2, y2) = start, end
+    (column1, row1), (column2, row2) = start_cell, end_cell
+
+    if row1 != row2 or column2 - column1 == 1:
+        sx, sy = _boundary(x1, y1, x2 - x1, y2 - y1, node_width)
+        ex, ey = _boundary(x2, y2, x1 - x2, y1 - y2, node_width)
+        return (f'<line x1="{sx:.1f}" y1="{sy:.1f}" x2="{ex:.1f}" y2="{ey:.1f}" stroke="{color}" '
+                f'stroke-width="1.5"{dash} marker-end="url(#{marker})"/>')
+
+    # Same row but not adjacent, or a step back: arc above row 0, below row 1.
+    direction = -1 if row1 == 0 else 1
+    sy = ey = y1 + direction * NODE_HEIGHT / 2
+    control_y = sy + direction * ARC_SPACE * 1.5
+    return (f'<path d="M{x1:.1f},{sy:.1f} Q{(x1 + x2) / 2:.1f},{control_y:.1f} {x2:.1f},{ey:.1f}" '
+            f'fill="none" stroke="{color}" stroke-width="1.5"{dash} marker-end="url(#{marker})"/>')
+
+
+def _boundary(x, y, dx, dy, node_width):
+    """Point where the ray from a node's centre along (dx, dy) leaves its box."""
+    if dx == 0 and dy == 0:
+        return x, y
+    half_width, half_height = node_width / 2, NODE_HEIGHT / 2
+    scale = min(half_width / abs(dx) if dx else math.inf, half_height / abs(dy) if dy else math.inf)
+    return x + dx * scale, y + dy * scale
@@ -1,9 +1,8 @@
-import os
 import streamlit as st
 from game.game_logic import WordLadderGame
-from utils.dictionary_loader import DictionaryLoader
-from ui.graph_visualizer import GraphVisualizer
-from utils.word_generator import RandomWordGenerator
+from utils.dictionary_loader import get_shared_dictionary
+from ui.ladder_renderer import LadderRenderer
+from utils.word_generator import get_shared_generator
 from ui.algorithm_stats import AlgorithmVisualizer
 
 
@@ -12,16 +11,17 @@ def main_screen():
     st.title("Word Ladder Adventure Game")
     st.write("Transform one word into another by changing one letter at a time!")
 
-    static_dir = os.path.join(os.path.dirname(__file__), '..', 'static')
-    os.makedirs(static_dir, exist_ok=True)
-    image_path = os.path.join(static_dir, 'word_ladder')
-
+    # Sessions only hold references to the process-wide dictionary and generator.
     if 'dictionary_loader' not in st.session_state:
-        st.session_state.dictionary_loader = DictionaryLoader('data/dictionary.txt')
+        st.session_state.dictionary_loader = get_shared_dictionary('data/dictionary.txt')
 
     if 'word_generator' not in st.session_state:
         dictionary = st.session_state.dictionary_loader.get_all_words()
-        st.session_state.word_generator = RandomWordGenerator(dictionary)
+        st.session_state.word_generator = get_shared_generator(dictionary)
+
+    # Ladder drawings are rendered in memory; identical ones come from a shared cache.
+    if 'ladder_renderer' not in st.session_state:
+        st.session_state.ladder_renderer = LadderRenderer()
 
     with st.sidebar:
         st.header("Game Settings")
@@ -34,7 +34,7 @@ def main_screen():
         
         algorithm = st.radio(
             "Select Algorithm",
-            ['BFS', 'A*', 'UCS', 'GBFS'],
+            ['BFS', 'BiBFS', 'A*', 'UCS', 'GBFS'],
             help="Choose pathfinding algorithm"
         )
         
@@ -71,14 +71,7 @@ def main_screen():
                     st.error("Couldn't generate suitable word pair, try again")
 
         if st.button("New Game"):
-            for suffix in ['', '_final']:
-                if os.path.exists(f"{image_path}{suffix}.png"):
-                    try:
-                        os.remove(f"{image_path}{suffix}.png")
-                    except Exception:
-                        pass
-            
-            for key in ['current_graph', 'last_word', 'show_comparison']:
+            for key in ['show_comparison', 'move_message']:
                 if key in st.session_state:
                     del st.session_state[key]
             
@@ -128,6 +121,9 @@ def main_screen():
             with col1:
                 st.subheader(f"Start: {game.start_word} → Target: {game.end_word}")
                 st.write(f"Current word: {game.current_word}")
+                move_message = st.session_state.pop('move_message', None)
+                if move_message:
+                    st.success(move_message)
                 st.write(f"Moves remaining: {game.moves_remaining}")
                 st.write(f"Hints remaining: {game.hints_remaining}")
                 
@@ -137,9 +133,8 @@ def main_screen():
                     if next_word:
                         success, message = game.make_move(next_word)
                         if success:
-                            st.success(message)
-                            if 'current_graph' in st.session_state:
-                                del st.session_state['current_graph']
+                            # Shown after the rerun, above the next input.
+                            st.session_state.move_message = message
                             
                             if game.game_over:
                                 st.session_state.show_comparison = True
@@ -159,21 +154,7 @@ def main_screen():
 
             with col2:
                 if len(game.player_path) > 1:
-                    if 'current_graph' not in st.session_state or 'last_word' not in st.session_state or st.session_state.last_word != game.current_word:
-                        gameplay_data = {
-                            'nodes': game.player_path.copy(),
-                            'edges': [(game.player_path[i], game.player_path[i+1]) 
-                                    for i in range(len(game.player_path)-1)],
-                            'solution_path': []
-                        }
-                        
-                        visualizer = GraphVisualizer()
-                        visualizer.create_graph(gameplay_data, image_path)
-                        st.session_state.current_graph = True
-                        st.session_state.last_word = game.current_word
-                    
-                    if os.path.exists(f"{image_path}.png"):
-                        st.image(f"{image_path}.png")
+                    st.image(st.session_state.ladder_renderer.render(game.player_path))
                 else:
                     st.info("Graph will appear when you make your first move")
 
@@ -223,11 +204,18 @@ def main_screen():
             
             if game.solution_path:
                 optimal_str = " → ".join(game.solution_path)
-                st.write(f"Optimal path ({len(game.solution_path)-1} moves): {optimal_str}")
+                ladders_ready = game.optimal_ladders_ready()
+                ladder_count = game.optimal_ladder_count() if ladders_ready else None
+                solution_rank = game.optimal_ladder_rank(game.solution_path) if ladders_ready else None
+                ladders = f", {solution_rank} of {ladder_count} optimal ladders" if ladder_count and solution_rank else ""
+                st.write(f"Optimal path ({len(game.solution_path)-1} moves{ladders}): {optimal_str}")
                 
                 player_moves = len(game.player_path) - 1
                 optimal_moves = len(game.solution_path) - 1
-                if player_moves == optimal_moves:
+                player_rank = game.optimal_ladder_rank(game.player_path) if ladders_ready else None
+                if player_rank and ladder_count and ladder_count > 1:
+                    st.success(f"🎯 Perfect! Your ladder is optimal: {player_rank} of {ladder_count} optimal ladders!")
+                elif player_moves == optimal_moves:
                     st.success("🎯 Perfect! You found the optimal solution!")
                 elif player_moves <= optimal_moves + 2:
                     st.success("👏 Great job! Your solution was very close to optimal!")
@@ -242,53 +230,46 @@ def main_screen():
             
             if game.solution_path:
                 optimal_str = " → ".join(game.solution_path)
-                st.write(f"Optimal path: {optimal_str}")
+                ladder_count = game.optimal_ladder_count() if game.optimal_ladders_ready() else None
+                ladders = f" (one of {ladder_count} optimal ladders)" if ladder_count and ladder_count > 1 else ""
+                st.write(f"Optimal path{ladders}: {optimal_str}")
 
         st.header("Final Path Visualization")
         
-        if not os.path.exists(f"{image_path}_final.png"):
-            final_graph_data = {
-                'nodes': game.player_path.copy(),
-                'edges': [(game.player_path[i], game.player_path[i+1]) 
-                        for i in range(len(game.player_path)-1)],
-                'solution_path': game.solution_path
-            }
-            
-            visualizer = GraphVisualizer()
-            visualizer.create_graph(final_graph_data, f"{image_path}_final")
-        
-        if os.path.exists(f"{image_path}_final.png"):
-            st.image(f"{image_path}_final.png")
+        final_svg = st.session_state.ladder_renderer.render(game.player_path, game.solution_path)
+        if final_svg:
+            st.image(final_svg)
         else:
             st.error("Could not generate final visualization")
         
         # ALWAYS show algorithm comparison at the end of the game
         st.header("Algorithm Comparison")
-        algo_stats = game.get_algorithm_comparison()
+        if not game.comparison_ready():
+            with st.spinner("Finishing the algorithm comparison..."):
+                algo_stats = game.get_algorithm_comparison()
+        else:
+            algo_stats = game.get_algorithm_comparison()
         
         if algo_stats:
             try:
-                fig = AlgorithmVisualizer.show_algorithm_comparison(algo_stats)
-                if fig:
-                    st.pyplot(fig)
+                chart = AlgorithmVisualizer.show_algorithm_comparison(algo_stats)
+                if chart:
+                    st.image(chart)
                     
                 st.subheader("Paths Found by Different Algorithms")
                 for algo, stats in algo_stats.items():
                     if stats and stats.get('path'):
                         path = stats.get('path')
                         if path:
-                            st.write(f"**{algo.upper()}** ({len(path)-1} moves): {' → '.join(path)}")
+                            expanded = stats.get('nodes_expanded')
+                            effort = f", {expanded} nodes expanded" if expanded is not None else ""
+                            st.write(f"**{algo.upper()}** ({len(path)-1} moves{effort}): {' → '.join(path)}")
                         else:
                             st.write(f"**{algo.upper()}**: No path found")
             except Exception as e:
                 st.error(f"Error displaying algorithm comparison: {str(e)}")
         else:
             st.warning("Algorithm comparison data not available")
-            
-        # Ensure algorithm comparison is always shown by forcing reload if not present
-        if 'algorithm_displayed' not in st.session_state:
-            st.session_state.algorithm_displayed = True
-            st.rerun()
 
         st.markdown("""
         <style>
@@ -312,14 +293,7 @@ def main_screen():
         """, unsafe_allow_html=True)
         
         if st.button("Play Again", key="play_again"):
-            for suffix in ['', '_final']:
-                if os.path.exists(f"{image_path}{suffix}.png"):
-                    try:
-                        os.remove(f"{image_path}{suffix}.png")
-                    except Exception:
-                        pass
-            
-            for key in ['current_graph', 'last_word', 'show_comparison', 'algorithm_displayed']:
+            for key in ['show_comparison', 'move_message']:
                 if key in st.session_state:
                     del st.session_state[key]
             
@@ -344,6 +318,8 @@ def main_screen():
         st.markdown("""
         **BFS**: Finds shortest path by exploring all neighbors first
         
+        **BiBFS**: Shortest path found by searching from both words at once
+        
         **A***: Uses heuristics to find shortest path efficiently
         
         **UCS**: Explores paths with lowest cost first
@@ -0,0 +1,205 @@
+"""Solve word-ladder pairs in bulk and stream the results as JSONL.
+
+    python -m utils.batch_solver pairs.txt -o results.jsonl --algorithm bidirectional_bfs
+    cat pairs.txt | python -m utils.batch_solver --workers 8 --time-budget 2 --node-budget 50000
+
+Each input line is `START TARGET` (comma or whitespace separated) or a JSON
+object with "start" and "target"; blank lines and lines starting with # are
+skipped. Pairs are read lazily, grouped into chunks and sharded across
+worker processes. The workers map the same compiled dictionary, so the
+index is shared rather than re-loaded. At most --max-pending chunks are in
+flight, which keeps memory bounded however long the input is, and every
+chunk is written out as soon as it finishes, so output order follows
+completion order; use the "index" field to match results to input lines.
+"""
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import json
+import logging
+import os
+import sys
+import time
+
+from algorithms.algorithm_factory import AlgorithmFactory
+from algorithms.parallel_comparison import solve
+from algorithms.search_budget import SearchBudget
+from algorithms.search_stats import SearchStats
+from utils.dictionary_loader import DEFAULT_DICTIONARY_FILE, get_shared_dictionary
+
+# Set in each worker process by _init_worker.
+_worker_state = {}
+
+
+def parse_pair(line):
+    """Return (start, target) from an input line, or None to skip it."""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    if line.startswith('{'):
+        record = json.loads(line)
+        return str(record['start']), str(record['target'])
+    parts = line.replace(',', ' ').split()
+    if len(parts) != 2:
+        raise ValueError(f"expected two words, got {len(parts)}")
+    return parts[0], parts[1]
+
+
+def read_chunks(lines, chunk_size):
+    """Yield lists of (index, start, target, error) tuples, chunk_size at a time."""
+    chunk = []
+    index = 0
+    for line in lines:
+        try:
+            pair = parse_pair(line)
+        except (ValueError, KeyError) as e:
+            chunk.append((index, None, None, f"invalid input line: {e}"))
+            index += 1
+        else:
+            if pair is None:
+                continue
+            chunk.append((index, pair[0], pair[1], None))
+            index += 1
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def solve_pair(index, start_word, target_word, algorithm_name, time_budget=None, node_budget=None,
+               collect_stats=True):
+    """Solve one pair against the worker's shared dictionary and return its JSON record."""
+    words = _worker_state['words']
+    start_word, target_word = start_word.upper(), target_word.upper()
+    record = {'index': index, 'start': start_word, 'target': target_word, 'algorithm': algorithm_name}
+
+    if len(start_word) != len(target_word) or start_word not in words or target_word not in words:
+        record.update(status='invalid', path=None, length=None)
+        return record
+    if not words.are_connected(start_word, target_word):
+        record.update(status='no_path', path=None, length=None, time_ms=0.0)
+        return record
+
+    budget = None
+    if time_budget or node_budget:
+        budget = SearchBudget(max_nodes=node_budget, max_seconds=time_budget)
+    result = solve(algorithm_name, start_word, target_word, words, collect_stats, budget)
+
+    if 'budget_exceeded' in result:
+        status = 'budget_exceeded'
+        record['reason'] = result['budget_exceeded']
+    else:
+        status = 'ok' if result['path'] else 'no_path'
+    record.update(status=status, path=result['path'], length=result['path_length'],
+                  time_ms=result['time_ns'] / 1e6)
+    if collect_stats:
+        record['stats'] = {name: result[name] for name in SearchStats.__slots__}
+    return record
+
+
+def solve_chunk(chunk, algorithm_name, time_budget, node_budget, collect_stats):
+    results = []
+    for index, start_word, target_word, error in chunk:
+        if error is not None:
+            results.append({'index': index, 'status': 'invalid', 'error': error})
+            continue
+        try:
+            results.append(solve_pair(index, start_word, target_word, algorithm_name,
+                                      time_budget, node_budget, collect_stats))
+        except Exception as e:
+            logging.error(f"Error solving {start_word} -> {target_word}: {str(e)}")
+            results.append({'index': index, 'start': start_word, 'target': target_word,
+                            'status': 'error', 'error': str(e)})
+    return results
+
+
+def _init_worker(dictionary_file):
+    _worker_state['words'] = get_shared_dictionary(dictionary_file).get_all_words()
+
+
+def write_results(results, output):
+    output.write(''.join(json.dumps(result) + '\n' for result in results))
+    output.flush()
+
+
+def run_batch(lines, output, algorithm_name='bidirectional_bfs', dictionary_file=DEFAULT_DICTIONARY_FILE,
+              workers=None, chunk_size=500, max_pending=None, time_budget=None, node_budget=None,
+              collect_stats=True):
+    """Solve every pair in lines and write one JSON record per pair to output.
+
+    Returns a dict of counts per result status.
+    """
+    AlgorithmFactory.create_algorithm(algorithm_name)
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    counts = {}
+
+    def record(results):
+        write_results(results, output)
+        for result in results:
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+
+    # Make sure the compiled cache exists before workers try to map it.
+    get_shared_dictionary(dictionary_file)
+
+    if workers == 1:
+        _init_worker(dictionary_file)
+        for chunk in read_chunks(lines, chunk_size):
+            record(solve_chunk(chunk, algorithm_name, time_budget, node_budget, collect_stats))
+        return counts
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(dictionary_file,)) as executor:
+        pending = set()
+        for chunk in read_chunks(lines, chunk_size):
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(future.result())
+            pending.add(executor.submit(solve_chunk, chunk, algorithm_name, time_budget, node_budget, collect_stats))
+
+        for future in wait(pending).done:
+            record(future.result())
+
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m utils.batch_solver',
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument('input', nargs='?', default='-', help="file of word pairs, or - for stdin")
+    parser.add_argument('-o', '--output', default='-', help="JSONL output file, or - for stdout")
+    parser.add_argument('--algorithm', default='bidirectional_bfs', choices=AlgorithmFactory.list_algorithms())
+    parser.add_argument('--dictionary', default=DEFAULT_DICTIONARY_FILE)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=500, help="pairs per worker task")
+    parser.add_argument('--max-pending', type=int, default=None, help="chunks in flight (default: 2 x workers)")
+    parser.add_argument('--time-budget', type=float, default=None, help="seconds allowed per pair")
+    parser.add_argument('--node-budget', type=int, default=None, help="nodes one search may expand")
+    parser.add_argument('--no-stats', action='store_true', help="skip search counters")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    source = sys.stdin if args.input == '-' else open(args.input, 'r')
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    try:
+        started = time.perf_counter()
+        counts = run_batch(source, output, args.algorithm, args.dictionary, args.workers,
+                           args.chunk_size, args.max_pending, args.time_budget, args.node_budget,
+                           not args.no_stats)
+        elapsed = time.perf_counter() - started
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    total = sum(counts.values())
+    logging.info(f"Solved {total} pairs in {elapsed:.2f}s ({total / elapsed if elapsed else 0:.0f} pairs/s): "
+                 + ", ".join(f"{status}={count}" for status, count in sorted(counts.items())))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,14 +9,20 @@ DIFFICULTY_SETTINGS = {
     "beginner": {
         "max_word_length": 5,  
         "min_word_length": 3, 
+        "min_ladder_distance": 2,
+        "max_ladder_distance": 4,
     },
     "advanced": {
         "max_word_length": 7,
         "min_word_length": 4,  
+        "min_ladder_distance": 4,
+        "max_ladder_distance": 6,
     },
     "challenge": {
         "max_word_length": 8,  
         "min_word_length": 5,   
+        "min_ladder_distance": 5,
+        "max_ladder_distance": 9,
         "additional_constraints": True,  
     },
 }
@@ -24,6 +30,15 @@ DIFFICULTY_SETTINGS = {
 ALGORITHM_SETTINGS = {
     "default_algorithm": "a_star",  
     "available_algorithms": ["ucs", "a_star", "bfs", "gbfs"],  
+    "comparison_timeout": 10.0,
+    "search_node_budget": None,  # nodes one search may expand, None for no limit
+    "search_time_budget": 10.0,  # seconds one search may run, None for no limit
+}
+
+PAIR_POOL_SETTINGS = {
+    "size": 32,  # ready pairs kept per difficulty
+    "low_water": 8,  # refill once a difficulty drops below this
+    "snapshot_file": "data/pair_pool.json",  # None to keep the pool in memory only
 }
 
 VISUALIZATION_SETTINGS = {
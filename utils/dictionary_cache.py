@@ -0,0 +1,205 @@
+"""Compiled, memory-mapped form of the word list.
+
+The cache file stores, for every word length, the sorted words as
+fixed-width ASCII records followed by the CSR offsets and targets, the
+connected-component labels and the ALT landmark distances of that length's
+WordGraph. Landmarks are selected here, once, when the cache is compiled.
+It is tied to the text dictionary by a SHA-256 of its contents, and a
+stale, truncated or unreadable cache is simply rebuilt.
+
+Layout (native byte order, sections 8-byte aligned):
+
+    header   MAGIC, version, byte order, sha256(text), section count
+    table    per length: length, words, edges, positions of each array
+    data     words | offsets (uint32, words + 1) | targets (uint32, edges)
+             | components (uint32, words)
+             | landmark ids (uint32, k) | landmark distances (uint8, k * words)
+"""
+from array import array
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from algorithms.neighbor_index import NeighborIndex
+from algorithms.word_graph import WordGraph
+
+MAGIC = b'WLADDER\0'
+VERSION = 3
+HEADER = struct.Struct('<8sIB32sI')
+SECTION = struct.Struct('<IIIQQQQIQ')
+BYTE_ORDER = 0 if sys.byteorder == 'little' else 1
+ID_TYPECODE = 'I'
+
+
+class FixedWidthWords:
+    """Read-only sorted sequence of equal-length words stored back to back."""
+
+    def __init__(self, buffer, length, count):
+        self.buffer = buffer
+        self.length = length
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError('word index out of range')
+        start = i * self.length
+        return str(self.buffer[start:start + self.length], 'ascii')
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+
+def cache_path_for(dictionary_file):
+    return os.path.splitext(dictionary_file)[0] + '.bin'
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _align(position):
+    return (position + 7) & ~7
+
+
+def write_cache(index, cache_path, digest):
+    """Write every length of index (building missing graphs) to cache_path."""
+    graphs = [index.graph(length) for length in index.lengths()]
+
+    table_end = HEADER.size + SECTION.size * len(graphs)
+    sections = []
+    position = _align(table_end)
+    for graph in graphs:
+        words_at = position
+        offsets_at = _align(words_at + len(graph) * graph.length)
+        targets_at = _align(offsets_at + (len(graph) + 1) * 4)
+        components_at = _align(targets_at + len(graph.targets) * 4)
+        landmarks_at = _align(components_at + len(graph) * 4)
+        landmark_count = len(graph.landmarks)
+        position = _align(landmarks_at + landmark_count * (4 + len(graph)))
+        sections.append((graph, words_at, offsets_at, targets_at, components_at, landmarks_at))
+
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.dictionary-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, BYTE_ORDER, digest, len(graphs)))
+            for graph, words_at, offsets_at, targets_at, components_at, landmarks_at in sections:
+                f.write(SECTION.pack(graph.length, len(graph), len(graph.targets),
+                                     words_at, offsets_at, targets_at, components_at,
+                                     len(graph.landmarks), landmarks_at))
+
+            for graph, words_at, offsets_at, targets_at, components_at, landmarks_at in sections:
+                f.seek(words_at)
+                f.write(''.join(graph.words).encode('ascii'))
+                f.seek(offsets_at)
+                array(ID_TYPECODE, graph.offsets).tofile(f)
+                f.seek(targets_at)
+                array(ID_TYPECODE, graph.targets).tofile(f)
+                f.seek(components_at)
+                array(ID_TYPECODE, graph.components).tofile(f)
+                f.seek(landmarks_at)
+                array(ID_TYPECODE, [landmark for landmark, _ in graph.landmarks]).tofile(f)
+                for _, distances in graph.landmarks:
+                    f.write(bytes(distances))
+
+            f.truncate(position)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_cache(cache_path, digest):
+    """Memory-map cache_path and return a NeighborIndex, or None if it is stale or unreadable."""
+    try:
+        with open(cache_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapped) < HEADER.size:
+        return None
+
+    magic, version, byte_order, stored_digest, section_count = HEADER.unpack_from(mapped, 0)
+    if (magic, version, byte_order, stored_digest) != (MAGIC, VERSION, BYTE_ORDER, digest):
+        return None
+
+    try:
+        graphs = _read_sections(mapped, section_count)
+    except (struct.error, ValueError, IndexError, TypeError) as e:
+        logging.warning(f"Dictionary cache {cache_path} is corrupt ({e}), rebuilding it")
+        return None
+    if graphs is None:
+        logging.warning(f"Dictionary cache {cache_path} is truncated, rebuilding it")
+        return None
+
+    return NeighborIndex(graphs=graphs, fingerprint=digest.hex())
+
+
+def _read_sections(mapped, section_count):
+    """WordGraphs over the mapped sections, or None if one runs past the file."""
+    view = memoryview(mapped)
+    graphs = {}
+    for i in range(section_count):
+        (length, count, edges, words_at, offsets_at, targets_at, components_at,
+         landmark_count, landmarks_at) = SECTION.unpack_from(mapped, HEADER.size + i * SECTION.size)
+        distances_at = landmarks_at + landmark_count * 4
+        ends = (words_at + count * length, offsets_at + (count + 1) * 4, targets_at + edges * 4,
+                components_at + count * 4, distances_at + landmark_count * count)
+        if max(ends) > len(mapped):
+            return None
+        words = FixedWidthWords(view[words_at:words_at + count * length], length, count)
+        offsets = view[offsets_at:offsets_at + (count + 1) * 4].cast(ID_TYPECODE)
+        targets = view[targets_at:targets_at + edges * 4].cast(ID_TYPECODE)
+        components = view[components_at:components_at + count * 4].cast(ID_TYPECODE)
+        landmark_ids = view[landmarks_at:landmarks_at + landmark_count * 4].cast(ID_TYPECODE)
+        if offsets[count] != edges:
+            raise ValueError(f"offsets of length {length} do not match its edge count")
+        landmarks = [
+            (landmark_ids[k], view[distances_at + k * count:distances_at + (k + 1) * count])
+            for k in range(landmark_count)
+        ]
+        graphs[length] = WordGraph(length, words, offsets, targets, components, landmarks)
+    return graphs
+
+
+def load_compiled_dictionary(dictionary_file, cache_path=None):
+    """Return a NeighborIndex for dictionary_file, compiling the cache if needed."""
+    cache_path = cache_path or cache_path_for(dictionary_file)
+    digest = file_digest(dictionary_file)
+
+    index = read_cache(cache_path, digest)
+    if index is not None:
+        index.dictionary_file = dictionary_file
+        return index
+
+    logging.info(f"Compiling dictionary cache {cache_path}")
+    with open(dictionary_file, 'r') as f:
+        index = NeighborIndex((word.strip() for word in f if word.strip()), fingerprint=digest.hex())
+
+    try:
+        write_cache(index, cache_path, digest)
+        index = read_cache(cache_path, digest) or index
+    except (OSError, UnicodeEncodeError) as e:
+        logging.warning(f"Could not write dictionary cache {cache_path}: {e}")
+
+    index.dictionary_file = dictionary_file
+    return index
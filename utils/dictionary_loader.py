@@ -1,14 +1,47 @@
+import os
+import threading
+from algorithms.neighbor_index import get_neighbor_index
+from utils.dictionary_cache import load_compiled_dictionary
+
+DEFAULT_DICTIONARY_FILE = 'data/dictionary.txt'
+
+
 class DictionaryLoader:
-    def __init__(self, dictionary_file):
+    def __init__(self, dictionary_file, use_cache=True):
         self.dictionary_file = dictionary_file
+        self.use_cache = use_cache
         self.words = self.load_dictionary()
         
     def load_dictionary(self):
         try:
+            if self.use_cache:
+                return load_compiled_dictionary(self.dictionary_file)
             with open(self.dictionary_file, 'r') as f:
                 return {word.strip().upper() for word in f if word.strip()}
         except FileNotFoundError:
             raise FileNotFoundError(f"Dictionary file not found: {self.dictionary_file}")
             
     def get_all_words(self):
-        return self.words
\ No newline at end of file
+        return self.words
+
+    def get_neighbor_index(self):
+        return get_neighbor_index(self.words)
+
+
+_shared_loaders = {}
+_shared_loaders_lock = threading.Lock()
+
+
+def get_shared_dictionary(dictionary_file=DEFAULT_DICTIONARY_FILE):
+    """Return the process-wide DictionaryLoader for dictionary_file.
+
+    The loaded index is read-only, so every game session can hold a reference
+    to it instead of keeping its own copy of the word list.
+    """
+    key = os.path.abspath(dictionary_file)
+    with _shared_loaders_lock:
+        loader = _shared_loaders.get(key)
+        if loader is None:
+            loader = DictionaryLoader(dictionary_file)
+            _shared_loaders[key] = loader
+        return loader
@@ -0,0 +1,129 @@
+from collections import deque
+import json
+import logging
+import os
+import tempfile
+import threading
+
+
+class PairPool:
+    """Ready-made (start, end, distance) word pairs per difficulty.
+
+    find_pair(difficulty) must return a verified pair or None. Once started,
+    a background thread tops every difficulty up to size whenever a pop()
+    leaves one below low_water. With a snapshot_file the pool is saved after
+    each refill and reloaded on start, as long as it was built from the same
+    dictionary fingerprint.
+    """
+
+    def __init__(self, find_pair, difficulties, fingerprint=None, size=32, low_water=8, snapshot_file=None):
+        self.find_pair = find_pair
+        self.fingerprint = fingerprint
+        self.size = size
+        self.low_water = low_water
+        self.snapshot_file = snapshot_file
+        self._pairs = {difficulty: deque() for difficulty in difficulties}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.snapshot_file:
+            self.load_snapshot()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='pair-pool', daemon=True)
+            self._thread.start()
+        self._wakeup.set()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+
+    def pop(self, difficulty):
+        """Take one pair, or return None if that difficulty has run dry."""
+        with self._lock:
+            pairs = self._pairs.get(difficulty)
+            if pairs is None:
+                return None
+            pair = pairs.popleft() if pairs else None
+            running_low = len(pairs) < self.low_water
+        if running_low:
+            self._wakeup.set()
+        return pair
+
+    def sizes(self):
+        with self._lock:
+            return {difficulty: len(pairs) for difficulty, pairs in self._pairs.items()}
+
+    def fill(self):
+        """Top every difficulty up to size; returns the number of pairs added."""
+        added = 0
+        for difficulty, pairs in self._pairs.items():
+            failures = 0
+            while len(pairs) < self.size and failures < self.size and not self._stopped.is_set():
+                pair = self.find_pair(difficulty)
+                if pair is None:
+                    failures += 1
+                    continue
+                with self._lock:
+                    if pair not in pairs:
+                        pairs.append(pair)
+                        added += 1
+        return added
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                if self.fill() and self.snapshot_file:
+                    self.save_snapshot()
+            except Exception as e:
+                logging.error(f"Error refilling pair pool: {str(e)}")
+
+    def load_snapshot(self):
+        try:
+            with open(self.snapshot_file) as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read pair pool snapshot {self.snapshot_file}: {e}")
+            return 0
+
+        if snapshot.get('fingerprint') != self.fingerprint:
+            return 0
+
+        loaded = 0
+        with self._lock:
+            for difficulty, pairs in self._pairs.items():
+                for start_word, end_word, distance in snapshot.get('pairs', {}).get(difficulty, []):
+                    pair = (start_word, end_word, distance)
+                    if len(pairs) < self.size and pair not in pairs:
+                        pairs.append(pair)
+                        loaded += 1
+        return loaded
+
+    def save_snapshot(self):
+        with self._lock:
+            snapshot = {
+                'fingerprint': self.fingerprint,
+                'pairs': {difficulty: [list(pair) for pair in pairs] for difficulty, pairs in self._pairs.items()}
+            }
+
+        directory = os.path.dirname(os.path.abspath(self.snapshot_file))
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.pair-pool-', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(snapshot, f)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.snapshot_file)
+        except OSError as e:
+            logging.warning(f"Could not write pair pool snapshot {self.snapshot_file}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -1,61 +1,137 @@
 import random
-from algorithms.bfs import bfs  
-from algorithms.gbfs import greedy_best_first_search
-from algorithms.a_star import a_star_search
-from algorithms.ucs import uniform_cost_search
-import time
+from algorithms.neighbor_index import get_neighbor_index
+from algorithms.distance_map import DistanceMap
+from algorithms.landmarks import UNREACHABLE
+from utils.config import DIFFICULTY_SETTINGS, PAIR_POOL_SETTINGS
+from utils.pair_pool import PairPool
+import heapq
+import threading
+
+DIFFICULTY_LENGTHS = {
+    "easy": [3, 4],
+    "medium": [5],
+    "hard": [6, 7],
+}
+
+DIFFICULTY_DISTANCES = {
+    "easy": (2, 4),
+    "medium": (4, 6),
+    "hard": (5, 9),
+}
 
 class RandomWordGenerator:
     def __init__(self, dictionary):
         self.dictionary = dictionary
-        self.word_lengths = {3: [], 4: [], 5: [], 6: [], 7: []}
-        self._categorize_words()
-        
-    def _categorize_words(self):
-        """Categorize words by length for faster retrieval"""
-        for word in self.dictionary:
-            length = len(word)
-            if 3 <= length <= 7:  
-                if word not in self.word_lengths[length]:
-                    self.word_lengths[length].append(word)
-
-    def get_random_pair(self, difficulty="medium"):
+        self.neighbor_index = get_neighbor_index(dictionary)
+        self.pair_pool = None
+
+    def lengths_for(self, difficulty):
+        """Word lengths for easy/medium/hard or for a DIFFICULTY_SETTINGS level."""
+        settings = DIFFICULTY_SETTINGS.get(difficulty)
+        if settings is not None:
+            lengths = range(settings["min_word_length"], settings["max_word_length"] + 1)
+        else:
+            lengths = DIFFICULTY_LENGTHS.get(difficulty, DIFFICULTY_LENGTHS["hard"])
+        return [length for length in lengths if length in self.neighbor_index.words_by_length]
+
+    def distances_for(self, difficulty):
+        """(shortest, longest) ladder distance for easy/medium/hard or a DIFFICULTY_SETTINGS level."""
+        settings = DIFFICULTY_SETTINGS.get(difficulty)
+        if settings is not None and "min_ladder_distance" in settings:
+            return settings["min_ladder_distance"], settings["max_ladder_distance"]
+        return DIFFICULTY_DISTANCES.get(difficulty, DIFFICULTY_DISTANCES["hard"])
+
+    def start_pair_pool(self, size=32, low_water=8, snapshot_file=None):
+        """Serve get_random_pair from a PairPool refilled in the background."""
+        if self.pair_pool is None:
+            self.pair_pool = PairPool(self.find_pair, list(DIFFICULTY_LENGTHS), self.neighbor_index.fingerprint,
+                                      size, low_water, snapshot_file)
+            self.pair_pool.start()
+        return self.pair_pool
+
+    def find_pair(self, difficulty="medium", attempts=5, distance=None):
+        """A random pair of hub words as (start, end, distance), or None.
+
+        One BFS from a random hub, stopped at the longest wanted distance,
+        gives every candidate end word at once; the end is drawn from the
+        words at exactly distance steps, or at a random distance in the
+        difficulty's range, so no pair is searched and thrown away.
+        """
+        if distance is not None and not 1 <= distance < UNREACHABLE:
+            raise ValueError(f"Distance must be between 1 and {UNREACHABLE - 1}")
+        lengths = self.lengths_for(difficulty)
+        if not lengths:
+            return None
+        hub_index = self.neighbor_index.hub_index(random.choice(lengths))
+        graph = hub_index.graph
         
-        if difficulty == "easy":
-            lengths = [3, 4]
-        elif difficulty == "medium":
-            lengths = [5]
-        else:  # hard
-            lengths = [6, 7]
+        if len(hub_index) < 2:
+            return None
+        shortest, longest = (distance, distance) if distance is not None else self.distances_for(difficulty)
             
-        length = random.choice(lengths)
-        words = self.word_lengths[length]
+        for _ in range(attempts):
+            start_id = random.choice(hub_index.hubs)
+            distances = DistanceMap(graph, start_id, graph.distances_from(start_id, longest), longest)
+            wanted = list(range(shortest, longest + 1))
+            random.shuffle(wanted)
+            for steps in wanted:
+                ends = distances.ids_at(steps)
+                hub_ends = [end_id for end_id in ends if hub_index.is_hub(end_id)]
+                if hub_ends or ends:
+                    end_id = random.choice(hub_ends or ends)
+                    return graph.word_at(start_id), graph.word_at(end_id), steps
+        
+        return None
+
+    def get_random_pair(self, difficulty="medium", distance=None):
+        if self.pair_pool is not None and distance is None:
+            pair = self.pair_pool.pop(difficulty)
+            if pair is not None:
+                return pair[0], pair[1]
         
-        if len(words) < 2:
+        pair = self.find_pair(difficulty, distance=distance)
+        if pair is not None:
+            return pair[0], pair[1]
+        if distance is not None:
+            # An explicit distance is never traded for an arbitrary pair.
             return None, None
-            
-        for _ in range(20):  # Try 20 times (increased from 10)
-            start_word = random.choice(words)
-            end_word = random.choice(words)
-            
-            if start_word != end_word:
-                path = bfs(start_word, end_word, self.dictionary)
-                if path and 2 <= len(path) <= 10: 
-                    return start_word, end_word
-                
-        common_words = self._get_most_connected_words(length)
-        if common_words and len(common_words) >= 2:
-            return random.choice(common_words), random.choice(common_words)
         
-        return words[0], words[-1]
-    
-    def _get_most_connected_words(self, length):
-        words = self.word_lengths[length][:100]  
-        if not words:
-            return []
-            
-        common_letters = 'ETAOINSRHL'
-        common_words = [word for word in words 
-                      if any(letter in word for letter in common_letters)]
+        lengths = self.lengths_for(difficulty)
+        if lengths:
+            common_words = self._get_most_connected_words(random.choice(lengths))
+            if len(common_words) >= 2:
+                start_word, end_word = random.sample(common_words, 2)
+                return start_word, end_word
         
-        return common_words or words
\ No newline at end of file
+        return None, None
+    
+    def _get_most_connected_words(self, length, count=100):
+        """The count highest-degree words of the largest component of length."""
+        hub_index = self.neighbor_index.hub_index(length)
+        graph = hub_index.graph
+        largest = [word_id for word_id in hub_index.hubs
+                   if graph.component_size(word_id) == hub_index.largest_component_size]
+        if largest:
+            # Ties in size could split these over two components; keep the first one's.
+            component = graph.component_of(largest[0])
+            largest = [word_id for word_id in largest if graph.component_of(word_id) == component]
+        return graph.to_words(heapq.nlargest(count, largest, key=hub_index.degree))
+
+
+_shared_generators = {}
+_shared_generators_lock = threading.Lock()
+
+
+def get_shared_generator(dictionary, use_pool=True):
+    """Return one RandomWordGenerator per dictionary object for the whole process.
+
+    With use_pool its pair pool is started from PAIR_POOL_SETTINGS.
+    """
+    with _shared_generators_lock:
+        generator = _shared_generators.get(id(dictionary))
+        if generator is None or generator.dictionary is not dictionary:
+            generator = RandomWordGenerator(dictionary)
+            _shared_generators[id(dictionary)] = generator
+        if use_pool:
+            generator.start_pair_pool(**PAIR_POOL_SETTINGS)
+        return generator